@@ -54,20 +54,51 @@ class FoldMixin:
         close_ch = self._BRACKET_PAIRS.get(open_ch)
         if close_ch is None:
             return None
+        return self._scan_bracket_forward(row, col + 1, open_ch, close_ch)
+
+    def _scan_bracket_forward(
+        self, row: int, col: int, open_ch: str, close_ch: str
+    ) -> tuple[int, int] | None:
+        """(row, col)부터 depth 1에서 시작해 짝이 맞는 close_ch 위치를 찾는다.
+
+        줄 단위가 아니라 전체 버퍼 문자열에서 str.find로 괄호 사이를 건너뛴다.
+        """
+        text = self.get_content()
+        start = self._line_starts()[row] + min(col, len(self.lines[row]))
+        find = text.find
         depth = 1
-        r, c = row, col + 1
-        while r < len(self.lines):
-            ln = self.lines[r]
-            while c < len(ln):
-                if ln[c] == open_ch:
-                    depth += 1
-                elif ln[c] == close_ch:
-                    depth -= 1
-                    if depth == 0:
-                        return (r, c)
-                c += 1
-            r += 1
-            c = 0
+        o = find(open_ch, start)
+        c = find(close_ch, start)
+        while c != -1:
+            if o != -1 and o < c:
+                depth += 1
+                o = find(open_ch, o + 1)
+            else:
+                depth -= 1
+                if depth == 0:
+                    return self._offset_to_pos(c)
+                c = find(close_ch, c + 1)
+        return None
+
+    def _scan_bracket_backward(
+        self, row: int, col: int, close_ch: str, open_ch: str
+    ) -> tuple[int, int] | None:
+        """(row, col)부터 역방향으로 짝이 맞는 open_ch 위치를 찾는다."""
+        text = self.get_content()
+        end = self._line_starts()[row] + col + 1
+        rfind = text.rfind
+        depth = 1
+        c = rfind(close_ch, 0, end)
+        o = rfind(open_ch, 0, end)
+        while o != -1:
+            if c > o:
+                depth += 1
+                c = rfind(close_ch, 0, c)
+            else:
+                depth -= 1
+                if depth == 0:
+                    return self._offset_to_pos(o)
+                o = rfind(open_ch, 0, o)
         return None
 
     def _find_foldable_at(self, line_idx: int) -> tuple[int, int] | None:
@@ -130,22 +161,23 @@ class FoldMixin:
         Returns (quote_start, quote_end, str_len) 또는 None.
         """
         line = self.lines[line_idx]
-        i = 0
-        while i < len(line):
-            if line[i] == '"':
-                start = i
-                i += 1
-                while i < len(line):
-                    if line[i] == '"' and line[i - 1] != "\\":
-                        break
-                    i += 1
-                end = i + 1
-                before = line[:start].rstrip()
-                if before.endswith(":"):
-                    str_len = end - start - 2
-                    if str_len >= self._string_collapse_threshold:
-                        return (start, end, str_len)
-            i += 1
+        threshold = self._string_collapse_threshold
+        if len(line) < threshold + 2:
+            return None
+        find = line.find
+        start = find('"')
+        while start != -1:
+            # 닫는 따옴표: 바로 앞이 백슬래시가 아닌 '"'
+            close = find('"', start + 1)
+            while close != -1 and line[close - 1] == "\\":
+                close = find('"', close + 1)
+            end = len(line) + 1 if close == -1 else close + 1
+            str_len = end - start - 2
+            if str_len >= threshold and line[:start].rstrip().endswith(":"):
+                return (start, end, str_len)
+            if close == -1:
+                return None
+            start = find('"', close + 1)
         return None
 
     def _toggle_fold(self, line_idx: int) -> None:
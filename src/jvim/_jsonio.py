@@ -0,0 +1,75 @@
+"""JSON parsing helpers with an optional fast backend (orjson)."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson은 64비트를 넘는 정수를 float로 읽는 버전이 있으므로 긴 숫자가
+# 보이면 표준 json으로 파싱한다 (문자열 안의 숫자도 보수적으로 포함)
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+
+
+def _std_validate(text: str) -> None:
+    """Raise ``json.JSONDecodeError`` if *text* is not valid JSON."""
+    json.loads(text)
+
+
+def _fast_validate(text: str) -> None:
+    """Raise ``json.JSONDecodeError`` if *text* is not valid JSON.
+
+    먼저 빠른 C 파서(orjson)로 검사하고, 실패 시에만 표준 json으로 다시
+    파싱한다. 결과(허용 범위·오류 메시지)는 항상 ``json.loads``와 같다.
+    """
+    try:
+        orjson.loads(text)
+        return
+    except orjson.JSONDecodeError:
+        pass
+    json.loads(text)
+
+
+def _fast_loads(text: str) -> Any:
+    """Parse *text* with the same result as ``json.loads``.
+
+    orjson으로 빠르게 파싱하고, orjson이 거부하는 입력(NaN, 범위 밖 숫자
+    등)이나 긴 정수가 있으면 표준 json으로 처리한다.
+    """
+    if _LONG_DIGITS_RE.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+# 백엔드는 import 시 한 번만 선택: orjson이 없으면 json.loads를 그대로
+# 노출해 호출마다의 래퍼/분기 비용도 없앤다
+if orjson is not None:
+    validate = _fast_validate
+    loads = _fast_loads
+else:  # pragma: no cover - optional dependency
+    validate = _std_validate
+    loads = json.loads
+
+
+# json.dumps는 기본값이 아닌 옵션을 받으면 호출마다 인코더를 새로 만들므로
+# 고정 옵션 인코더를 모듈 로드 시 한 번만 생성해 재사용한다
+_PRETTY_ENCODER = json.JSONEncoder(indent=4, ensure_ascii=False)
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Same as ``json.dumps(obj, indent=4, ensure_ascii=False)``."""
+    return _PRETTY_ENCODER.encode(obj)
+
+
+def dumps_compact(obj: Any) -> str:
+    """Same as ``json.dumps(obj, ensure_ascii=False)``."""
+    return _COMPACT_ENCODER.encode(obj)
@@ -117,18 +117,36 @@ def _recursive_descent(
     results: list[list[str | int]],
 ) -> None:
     """Recursively search for target_key in data."""
+    # 재귀 호출과 노드마다의 경로 리스트 복사 없이 명시적 스택으로 전위 순회.
+    # path는 하나의 리스트를 push/pop하며 공유 (_traverse는 매치 시 복사)
+    match_all = target_key == "*"
+    path = current_path.copy()
+    base = len(path)
     if isinstance(data, dict):
-        for k, v in data.items():
-            if target_key == "*" or k == target_key:
-                _traverse(v, remaining_path, current_path + [k], results)
-            _recursive_descent(
-                v, target_key, remaining_path, current_path + [k], results
-            )
+        stack = [(iter(data.items()), True)]
     elif isinstance(data, list):
-        for i, v in enumerate(data):
-            _recursive_descent(
-                v, target_key, remaining_path, current_path + [i], results
-            )
+        stack = [(enumerate(data), False)]
+    else:
+        return
+    while stack:
+        items, is_dict = stack[-1]
+        for k, v in items:
+            if is_dict and (match_all or k == target_key):
+                path.append(k)
+                _traverse(v, remaining_path, path, results)
+                path.pop()
+            if isinstance(v, dict):
+                path.append(k)
+                stack.append((iter(v.items()), True))
+                break
+            if isinstance(v, list):
+                path.append(k)
+                stack.append((enumerate(v), False))
+                break
+        else:
+            stack.pop()
+            if len(path) > base:
+                path.pop()
 
 
 def parse_jsonpath_filter(pattern: str) -> tuple[str, str, object]:
@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import json
 import re
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import le
 
+from jvim._jsonio import dumps_compact
+from jvim._jsonio import loads as json_loads
 from jvim._jsonpath import (
     get_value_at_path,
     jsonpath_find,
@@ -12,6 +17,15 @@ from jvim._jsonpath import (
     parse_jsonpath_filter,
 )
 
+# 정규식 메타문자: 하나도 없으면 패턴을 리터럴로 보고 str.find로 검색
+_REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+# 숫자 리터럴의 첫 글자 이후 부분
+_NUM_BODY_RE = re.compile(r"[0-9.eE+-]*")
+# 파싱에 실패한 JSONL 블록 표시 (JSON null과 구분)
+INVALID_BLOCK = object()
+# JSON 문자열 (이스케이프 포함) + 뒤따르는 colon(있으면 키)
+_STRING_RE = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*")([ \t]*:)?')
+
 
 class SearchMixin:
     """Search-related methods for JsonEditor."""
@@ -65,11 +79,15 @@ class SearchMixin:
         """Add pattern to search history, avoiding duplicates."""
         if not pattern:
             return
-        if pattern in self._search_history:
-            self._search_history.remove(pattern)
-        self._search_history.insert(0, pattern)
-        if len(self._search_history) > self._search_history_max:
-            self._search_history.pop()
+        history = self._search_history
+        if history and history[0] == pattern:
+            return
+        # 중복이면 제거(한 번의 스캔), 아니면 새 항목 자리를 미리 비움
+        try:
+            history.remove(pattern)
+        except ValueError:
+            del history[self._search_history_max - 1 :]
+        history.insert(0, pattern)
 
     def _search_history_prev(self) -> None:
         """Navigate to previous search in history."""
@@ -90,11 +108,15 @@ class SearchMixin:
 
     def _build_search_row_index(self) -> None:
         """Build row-indexed lookup for search matches."""
-        self._search_match_by_row = {}
+        # JSONPath 결과는 행 순서가 아닐 수 있으므로 groupby 대신 setdefault
+        by_row: dict[int, list[tuple[int, int, int]]] = {}
+        setdefault = by_row.setdefault
         for mi, (row, start, end) in enumerate(self._search_matches):
-            if row not in self._search_match_by_row:
-                self._search_match_by_row[row] = []
-            self._search_match_by_row[row].append((start, end, mi))
+            setdefault(row, []).append((start, end, mi))
+        self._search_match_by_row = by_row
+        # 텍스트 검색은 항상 정렬되어 있고, JSONPath 결과는 경로 순이라 다를 수 있음
+        matches = self._search_matches
+        self._search_matches_sorted = all(map(le, matches, islice(matches, 1, None)))
 
     def _execute_search(self) -> None:
         """Execute search and find all matches."""
@@ -117,19 +139,29 @@ class SearchMixin:
         elif pattern.islower():
             flags = re.IGNORECASE
 
-        self._search_matches = []
-        try:
-            regex = re.compile(pattern, flags)
-        except re.error as e:
-            self.status_msg = f"Invalid pattern: {e}"
-            self._search_match_by_row = {}
-            self._current_match = -1
-            return
-
-        for row, line in enumerate(self.lines):
-            for match in regex.finditer(line):
-                self._search_matches.append((row, match.start(), match.end()))
-        self._build_search_row_index()
+        # 같은 버퍼에 같은 패턴을 다시 검색하면 이전 결과를 재사용
+        lines = self.lines
+        key = (pattern, flags)
+        cached = self._search_cache
+        if (
+            cached
+            and cached[0] is lines
+            and cached[1] == self._lines_version
+            and cached[2] == key
+        ):
+            self._search_matches = cached[3]
+            self._search_match_by_row = cached[4]
+            self._search_matches_sorted = True
+        else:
+            if not self._scan_search_matches(pattern, flags):
+                return
+            self._search_cache = (
+                lines,
+                self._lines_version,
+                key,
+                self._search_matches,
+                self._search_match_by_row,
+            )
 
         if not self._search_matches:
             self.status_msg = f"Pattern not found: {self._search_pattern}"
@@ -139,6 +171,53 @@ class SearchMixin:
         self._current_match = self._find_match_near_cursor()
         self._goto_current_match()
 
+    def _scan_search_matches(self, pattern: str, flags: int) -> bool:
+        """Collect text matches of *pattern*; return False on an invalid regex."""
+        self._search_matches = []
+        matches = self._search_matches
+        if not flags and pattern and _REGEX_META_RE.search(pattern) is None:
+            # 대소문자 구분 리터럴: C 레벨 str.find 스캔
+            plen = len(pattern)
+            content = self.get_content()
+            count = content.count(pattern)
+            if count * 4 < len(self.lines):
+                # 매치가 드물면 전체 버퍼에서 한 번에 찾고 오프셋을 (row, col)로
+                # 변환 (패턴에 줄바꿈이 없으므로 라인을 넘는 매치는 없다)
+                starts = self._line_starts()
+                find = content.find
+                row = 0
+                line_start = 0
+                next_start = starts[1]
+                pos = find(pattern)
+                while pos != -1:
+                    if pos >= next_start:
+                        row = bisect_right(starts, pos, row) - 1
+                        line_start = starts[row]
+                        next_start = starts[row + 1]
+                    col = pos - line_start
+                    matches.append((row, col, col + plen))
+                    pos = find(pattern, pos + plen)
+            else:
+                for row, line in enumerate(self.lines):
+                    col = line.find(pattern)
+                    while col != -1:
+                        matches.append((row, col, col + plen))
+                        col = line.find(pattern, col + plen)
+        else:
+            # re.compile은 (pattern, flags)별로 내부 캐시되므로 n/N 반복 시 재컴파일 없음
+            try:
+                regex = re.compile(pattern, flags)
+            except re.error as e:
+                self.status_msg = f"Invalid pattern: {e}"
+                self._search_match_by_row = {}
+                self._current_match = -1
+                return False
+            for row, line in enumerate(self.lines):
+                for match in regex.finditer(line):
+                    matches.append((row, match.start(), match.end()))
+        self._build_search_row_index()
+        return True
+
     def _execute_jsonpath_search(self, path: str) -> None:
         """Execute JSONPath search and find all matches."""
         if self.jsonl:
@@ -195,7 +274,7 @@ class SearchMixin:
         """Execute JSONPath search across JSONL records."""
         jsonpath, op, filter_value = parse_jsonpath_filter(path)
 
-        blocks = self._split_jsonl_blocks(self.get_content())
+        blocks = self._parsed_jsonl_blocks()
 
         if not blocks:
             self.status_msg = "No JSONL records found"
@@ -206,10 +285,8 @@ class SearchMixin:
         block_start_lines = self._compute_block_start_lines()
 
         all_results: list[tuple[int, object, list[str | int]]] = []
-        for block_idx, block in enumerate(blocks):
-            try:
-                data = json.loads(block)
-            except json.JSONDecodeError:
+        for block_idx, data in enumerate(blocks):
+            if data is INVALID_BLOCK:
                 continue
 
             try:
@@ -254,39 +331,57 @@ class SearchMixin:
         self._current_match = self._find_match_near_cursor()
         self._goto_current_match()
 
+    def _parsed_jsonl_blocks(self) -> list[object]:
+        """Parse each JSONL block, cached per buffer version.
+
+        Blocks that fail to parse are ``INVALID_BLOCK``.  The parsed values
+        are shared between calls; callers must not mutate them.
+        """
+        lines = self.lines
+        cached = self._jsonl_parsed_cache
+        if cached and cached[0] is lines and cached[1] == self._lines_version:
+            return cached[2]
+        parsed: list[object] = []
+        for block in self._split_jsonl_blocks(self.get_content()):
+            try:
+                parsed.append(json_loads(block))
+            except json.JSONDecodeError:
+                parsed.append(INVALID_BLOCK)
+        self._jsonl_parsed_cache = (lines, self._lines_version, parsed)
+        return parsed
+
     def _build_key_index(self) -> dict[str, list[tuple[int, int]]]:
-        """Build an index of JSON keys to their (row, col) positions."""
+        """Build an index of JSON keys to their (row, col) positions.
+
+        The index is cached per buffer version; callers must not mutate it.
+        """
+        lines = self.lines
+        cached = self._key_index_cache
+        if cached and cached[0] is lines and cached[1] == self._lines_version:
+            return cached[2]
         index: dict[str, list[tuple[int, int]]] = {}
-        for row, line in enumerate(self.lines):
-            col = 0
-            while col < len(line):
-                quote_pos = line.find('"', col)
-                if quote_pos == -1:
-                    break
-                end_pos = quote_pos + 1
-                while end_pos < len(line):
-                    if line[end_pos] == '"' and line[end_pos - 1] != "\\":
-                        break
-                    end_pos += 1
-                if end_pos >= len(line):
-                    break
-                after = end_pos + 1
-                while after < len(line) and line[after] in " \t":
-                    after += 1
-                if after < len(line) and line[after] == ":":
-                    key = line[quote_pos : end_pos + 1]
-                    if key not in index:
-                        index[key] = []
-                    index[key].append((row, quote_pos))
-                col = end_pos + 1
+        finditer = _STRING_RE.finditer
+        for row, line in enumerate(lines):
+            if '"' not in line:
+                continue
+            # 문자열을 차례로 매치하고, 뒤에 colon이 오는 것만 키로 기록
+            for m in finditer(line):
+                key, colon = m.groups()
+                if colon:
+                    index.setdefault(key, []).append((row, m.start()))
+        self._key_index_cache = (lines, self._lines_version, index)
         return index
 
     def _compute_block_start_lines(self) -> dict[int, int]:
         """Compute the starting line number for each JSONL block."""
+        lines = self.lines
+        cached = self._block_starts_cache
+        if cached and cached[0] is lines and cached[1] == self._lines_version:
+            return cached[2]
         result: dict[int, int] = {}
         block_idx = 0
         in_block = False
-        for i, line in enumerate(self.lines):
+        for i, line in enumerate(lines):
             if line.strip():
                 if not in_block:
                     result[block_idx] = i
@@ -294,6 +389,7 @@ class SearchMixin:
                     in_block = True
             else:
                 in_block = False
+        self._block_starts_cache = (lines, self._lines_version, result)
         return result
 
     def _find_json_value_position_fast(
@@ -354,14 +450,18 @@ class SearchMixin:
             else:
                 if is_complex:
                     return None
-                target_str = json.dumps(current, ensure_ascii=False)
-                for row in range(start_line, len(self.lines)):
-                    line = self.lines[row]
-                    search_start = min_col if row == start_line else 0
-                    pos = line.find(target_str, search_start)
-                    if pos >= 0:
-                        return (row, pos, pos + len(target_str))
-                return None
+                if start_line >= len(self.lines):
+                    return None
+                # 스칼라 리터럴에는 줄바꿈이 없으므로 전체 버퍼를 한 번의
+                # str.find로 찾고 오프셋을 (row, col)로 변환
+                target_str = dumps_compact(current)
+                start_col = min(min_col, len(self.lines[start_line]))
+                offset = self._line_starts()[start_line] + start_col
+                pos = self.get_content().find(target_str, offset)
+                if pos < 0:
+                    return None
+                row, col = self._offset_to_pos(pos)
+                return (row, col, col + len(target_str))
         return None
 
     @staticmethod
@@ -371,22 +471,18 @@ class SearchMixin:
             return start
         ch = line[start]
         if ch == '"':
-            i = start + 1
-            while i < len(line):
-                if line[i] == '"' and line[i - 1] != "\\":
-                    return i + 1
-                i += 1
-            return len(line)
+            # 닫는 따옴표: 바로 앞이 백슬래시가 아닌 첫 '"' (str.find로 건너뜀)
+            i = line.find('"', start + 1)
+            while i != -1 and line[i - 1] == "\\":
+                i = line.find('"', i + 1)
+            return i + 1 if i != -1 else len(line)
         elif ch in "-0123456789":
-            i = start + 1
-            while i < len(line) and line[i] in "0123456789.eE+-":
-                i += 1
-            return i
-        elif line[start : start + 4] == "true":
+            return _NUM_BODY_RE.match(line, start + 1).end()
+        elif line.startswith("true", start):
             return start + 4
-        elif line[start : start + 5] == "false":
+        elif line.startswith("false", start):
             return start + 5
-        elif line[start : start + 4] == "null":
+        elif line.startswith("null", start):
             return start + 4
         return start
 
@@ -398,16 +494,29 @@ class SearchMixin:
         cursor_pos = (self.cursor_row, self.cursor_col)
 
         if self._search_forward:
+            if self._search_matches_sorted:
+                # (row, col) < (row, col, end): 첫 매치 >= 커서
+                i = bisect_left(self._search_matches, cursor_pos)
+                return i if i < len(self._search_matches) else 0
             for i, (row, col_start, _) in enumerate(self._search_matches):
                 if (row, col_start) >= cursor_pos:
                     return i
             return 0
         else:
-            for i in range(len(self._search_matches) - 1, -1, -1):
-                row, col_start, _ = self._search_matches[i]
-                if (row, col_start) <= cursor_pos:
-                    return i
-            return len(self._search_matches) - 1
+            i = self._last_match_at_or_before(cursor_pos)
+            return i if i >= 0 else len(self._search_matches) - 1
+
+    def _last_match_at_or_before(self, cursor_pos: tuple[int, int]) -> int:
+        """Return the last match index starting at or before *cursor_pos*, or -1."""
+        if self._search_matches_sorted:
+            # 시작 위치 <= (row, col) 은 매치 < (row, col + 1) 과 같다
+            row, col = cursor_pos
+            return bisect_left(self._search_matches, (row, col + 1)) - 1
+        for i in range(len(self._search_matches) - 1, -1, -1):
+            row, col_start, _ = self._search_matches[i]
+            if (row, col_start) <= cursor_pos:
+                return i
+        return -1
 
     def _goto_current_match(self) -> None:
         """Move cursor to the current match and update status."""
@@ -453,14 +562,7 @@ class SearchMixin:
                 self.cursor_row = len(self.lines) - 1
             self.cursor_col = len(self.lines[self.cursor_row])
 
-        cursor_pos = (self.cursor_row, self.cursor_col)
-        found = -1
-        for i in range(len(self._search_matches) - 1, -1, -1):
-            row, col_start, _ = self._search_matches[i]
-            if (row, col_start) <= cursor_pos:
-                found = i
-                break
-
+        found = self._last_match_at_or_before((self.cursor_row, self.cursor_col))
         if found >= 0:
             self._current_match = found
         else:
@@ -5,12 +5,14 @@ from __future__ import annotations
 import json
 import re
 
+from jvim._jsonio import dumps_compact
 from jvim._jsonpath import (
     get_value_at_path,
     jsonpath_find,
     jsonpath_value_matches,
     parse_jsonpath_filter,
 )
+from jvim._search import INVALID_BLOCK
 
 
 class SubstituteMixin:
@@ -88,7 +90,7 @@ class SubstituteMixin:
             self.status_msg = "invalid range"
             return
 
-        self._save_undo()
+        self._save_undo(start, end + 1)
 
         total_count = 0
         for row in range(start, end + 1):
@@ -120,7 +122,7 @@ class SubstituteMixin:
             pass
         if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
             return value
-        return json.dumps(value, ensure_ascii=False)
+        return dumps_compact(value)
 
     def _execute_substitute_jsonpath(
         self, pattern: str, replacement: str, flags_str: str
@@ -196,7 +198,7 @@ class SubstituteMixin:
                 self.status_msg = "JSONPath matched but key positions not found"
                 return
 
-            encoded = json.dumps(replacement, ensure_ascii=False)
+            encoded = dumps_compact(replacement)
         else:
             leaf_results = [
                 p
@@ -230,9 +232,8 @@ class SubstituteMixin:
 
             encoded = self._json_encode_replacement(replacement)
 
-        self._save_undo()
-
         positions.sort(key=lambda p: (p[0], p[1]), reverse=True)
+        self._save_undo(positions[-1][0], positions[0][0] + 1)
         for row, col_start, col_end in positions:
             line = self.lines[row]
             self.lines[row] = line[:col_start] + encoded + line[col_end:]
@@ -251,7 +252,7 @@ class SubstituteMixin:
         unconditional_value: bool = False,
     ) -> None:
         """JSONL 모드에서 JSONPath 치환."""
-        blocks = self._split_jsonl_blocks(self.get_content())
+        blocks = self._parsed_jsonl_blocks()
         if not blocks:
             self.status_msg = "No JSONL records found"
             return
@@ -259,10 +260,8 @@ class SubstituteMixin:
         block_start_lines = self._compute_block_start_lines()
 
         all_results: list[tuple[int, object, list[str | int]]] = []
-        for block_idx, block in enumerate(blocks):
-            try:
-                data = json.loads(block)
-            except json.JSONDecodeError:
+        for block_idx, data in enumerate(blocks):
+            if data is INVALID_BLOCK:
                 continue
             try:
                 results = jsonpath_find(data, jsonpath)
@@ -305,14 +304,13 @@ class SubstituteMixin:
             return
 
         encoded = (
-            json.dumps(replacement, ensure_ascii=False)
+            dumps_compact(replacement)
             if key_rename
             else self._json_encode_replacement(replacement)
         )
 
-        self._save_undo()
-
         positions.sort(key=lambda p: (p[0], p[1]), reverse=True)
+        self._save_undo(positions[-1][0], positions[0][0] + 1)
         for row, col_start, col_end in positions:
             line = self.lines[row]
             self.lines[row] = line[:col_start] + encoded + line[col_end:]
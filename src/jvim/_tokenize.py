@@ -0,0 +1,99 @@
+"""Per-line JSON syntax tokenizer used for highlighting."""
+
+from __future__ import annotations
+
+import re
+from itertools import groupby
+
+BRACKET_CHARS = frozenset("{}[]")
+DIGIT_CHARS = frozenset("0123456789.-+eE")
+KEYWORD_RE = re.compile(r"true|false|null")
+
+# 스타일 id → rich 스타일 이름 (id는 문자당 1바이트로 저장)
+STYLE_DEFAULT = 0
+STYLE_BRACKET = 1
+STYLE_KEY = 2
+STYLE_VALUE = 3
+STYLE_NUMBER = 4
+STYLE_KEYWORD = 5
+STYLE_NAMES = ("white", "bold white", "cyan", "green", "yellow", "magenta")
+_KEY_BYTE = bytes((STYLE_KEY,))
+_VALUE_BYTE = bytes((STYLE_VALUE,))
+_KEYWORD_BYTE = bytes((STYLE_KEYWORD,))
+
+
+# ASCII 문자 분류 테이블: ord(ch) < 128 이면 한 번의 인덱스 조회로 분류
+CHAR_CLASS = bytearray(128)
+for _ch in BRACKET_CHARS:
+    CHAR_CLASS[ord(_ch)] = STYLE_BRACKET
+for _ch in DIGIT_CHARS:
+    CHAR_CLASS[ord(_ch)] = STYLE_NUMBER
+del _ch
+# bytes.translate용 256바이트 표 (비ASCII는 "?"로 인코딩되어 STYLE_DEFAULT)
+_CLASS_TABLE = bytes(CHAR_CLASS) + bytes(128)
+# 문자열 안: 괄호만 bracket, 나머지(따옴표 포함)는 key
+_IN_STRING_TABLE = bytes(
+    STYLE_BRACKET if i == STYLE_BRACKET else STYLE_KEY for i in range(256)
+)
+
+
+def compute_style_ids(line: str) -> bytearray:
+    """Compute one style id per character of *line* (see ``STYLE_NAMES``)."""
+    if not line:
+        return bytearray()
+
+    # 1) 문자 분류를 C 레벨에서 한 번에: 비ASCII는 문자당 "?" 한 바이트
+    ids = bytearray(line.encode("ascii", "replace").translate(_CLASS_TABLE))
+
+    # 2) 문자열 구간을 find로 찾아 구간 단위로 key 스타일 적용.
+    #    따옴표는 바로 앞 문자가 백슬래시가 아닐 때만 열고 닫는다
+    find = line.find
+    n = len(line)
+    first_colon = -1
+    pos = 0
+    while pos < n:
+        q = find('"', pos)
+        while q > 0 and line[q - 1] == "\\":
+            q = find('"', q + 1)
+        # 문자열 밖 구간에서 첫 colon
+        if first_colon == -1:
+            first_colon = find(":", pos, n if q == -1 else q)
+        if q == -1:
+            break
+        close = find('"', q + 1)
+        while close != -1 and line[close - 1] == "\\":
+            close = find('"', close + 1)
+        end = n if close == -1 else close + 1
+        ids[q:end] = ids[q:end].translate(_IN_STRING_TABLE)
+        pos = end
+
+    # 첫 unquoted colon 이후의 문자열은 value
+    if first_colon != -1:
+        ids[first_colon:] = ids[first_colon:].replace(_KEY_BYTE, _VALUE_BYTE)
+
+    # Keywords outside strings (single regex pass); 키워드 첫 글자는
+    # 문자열 밖에서만 STYLE_DEFAULT
+    for m in KEYWORD_RE.finditer(line):
+        ms, me = m.start(), m.end()
+        if ids[ms] == STYLE_DEFAULT:
+            ids[ms:me] = _KEYWORD_BYTE * (me - ms)
+
+    return ids
+
+
+def compute_line_styles(line: str) -> list[str]:
+    """Compute syntax highlight styles for every character in *line*."""
+    return [STYLE_NAMES[sid] for sid in compute_style_ids(line)]
+
+
+def style_id_runs(
+    ids: bytearray, names: tuple[str, ...] = STYLE_NAMES
+) -> list[tuple[int, int, str]]:
+    """Group per-character style *ids* into ``(start, end, names[id])`` runs."""
+    runs: list[tuple[int, int, str]] = []
+    pos = 0
+    for sid, grp in groupby(ids):
+        end = pos + len(list(grp))
+        runs.append((pos, end, names[sid]))
+        pos = end
+    return runs
@@ -42,32 +42,43 @@ class VisualMixin:
             self.cursor_col = 0
             self.status_msg = f"{len(selected)} lines yanked"
             return
-        self._save_undo()
         self.yank_buffer = selected[:]
         deleted_count = er - sr + 1
-        if er < len(self.lines) - 1 or sr > 0:
-            self.lines[sr : er + 1] = []
+        last = len(self.lines) - 1
+        indent = 0
+        if op == "c" and selected[0].strip():
+            indent = len(selected[0]) - len(selected[0].lstrip())
+        if er < last or sr > 0:
+            start, end, new_lines = sr, er + 1, []
+            # 남는 줄이 빈 줄 하나뿐이면 c는 그 줄을 재사용
+            reuse = (
+                op == "c"
+                and last == deleted_count
+                and (self.lines[0] if sr else self.lines[-1]) == ""
+            )
+            if op == "c":
+                # 끝까지 지운 경우는 기존처럼 이전 줄 위에 새 줄을 연다
+                if reuse:
+                    start, end = 0, last + 1
+                elif er == last:
+                    start -= 1
+                    new_lines = [self.lines[start]]
+                new_lines.insert(0, " " * indent)
+            self._mutate(start, end, new_lines)
             self._adjust_line_indices(sr, -deleted_count)
-            if not self.lines:
-                self.lines = [""]
+            if op == "c":
+                if not reuse:
+                    self._adjust_line_indices(start, 1)
+                self.cursor_row = start
+            else:
+                self.cursor_row = min(sr, len(self.lines) - 1)
         else:
-            self.lines[sr : er + 1] = [""]
+            self._mutate(sr, er + 1, [" " * indent if op == "c" else ""])
             self._folds.clear()
             self._collapsed_strings.clear()
-        self.cursor_row = min(sr, len(self.lines) - 1)
-        self.cursor_col = 0
+            self.cursor_row = 0
+        self.cursor_col = indent
         if op == "c":
-            indent = (
-                len(selected[0]) - len(selected[0].lstrip())
-                if selected[0].strip()
-                else 0
-            )
-            if len(self.lines) == 1 and self.lines[0] == "":
-                self.lines[0] = " " * indent
-            else:
-                self.lines.insert(self.cursor_row, " " * indent)
-                self._adjust_line_indices(self.cursor_row, 1)
-            self.cursor_col = indent
             self._enter_insert()
         else:
             self.status_msg = f"{len(selected)} lines deleted"
@@ -90,18 +101,10 @@ class VisualMixin:
             self.cursor_col = sc
             self.status_msg = "yanked"
             return
-        self._save_undo()
         self.yank_buffer = [text]
-        if sr == er:
-            line = self.lines[sr]
-            self.lines[sr] = line[:sc] + line[ec + 1 :]
-        else:
-            before = self.lines[sr][:sc]
-            after = self.lines[er][ec + 1 :]
-            self.lines[sr] = before + after
-            deleted_count = er - sr
-            del self.lines[sr + 1 : er + 1]
-            self._adjust_line_indices(sr + 1, -deleted_count)
+        self._mutate(sr, er + 1, [self.lines[sr][:sc] + self.lines[er][ec + 1 :]])
+        if er > sr:
+            self._adjust_line_indices(sr + 1, -(er - sr))
         self.cursor_row = sr
         self.cursor_col = sc
         if op == "c":
@@ -11,6 +11,9 @@ from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, Header, Static
 
+from ._jsonio import dumps_compact
+from ._jsonio import loads as json_loads
+from ._jsonio import validate as validate_json
 from .widget import JsonEditor
 
 # Data directory path
@@ -72,6 +75,12 @@ class JsonEditorApp(App):
         self._ej_stack: list[tuple[int, int, int, str, str]] = []
         self._main_was_read_only: bool = False
         self._main_scroll_top: int = 0
+        # (lines, version, original, dirty) — 버퍼가 바뀔 때만 다시 비교
+        self._ej_dirty_cache: tuple[list[str], int, str, bool] | None = None
+        # 마지막으로 표시한 ej 제목의 (level, modified) — 같으면 갱신 생략
+        self._ej_title_state: tuple[int, bool] = (-1, False)
+        # help 편집기는 처음 :help 할 때 생성 (시작 시간/메모리 절약)
+        self._help_editor: JsonEditor | None = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -81,11 +90,10 @@ class JsonEditorApp(App):
             jsonl=self.jsonl,
             id="editor",
         )
-        with Vertical(id="help-panel"):
-            with Horizontal(id="help-header"):
-                yield Static("[b]Help[/b]", id="help-title")
-                yield Button("\u2715", id="help-close", variant="error")
-            yield JsonEditor(_load_data("help.json"), read_only=True, id="help-editor")
+        # help 편집기는 on_json_editor_help_toggle_requested에서 mount
+        with Vertical(id="help-panel"), Horizontal(id="help-header"):
+            yield Static("[b]Help[/b]", id="help-title")
+            yield Button("\u2715", id="help-close", variant="error")
         with Vertical(id="ej-panel"):
             with Horizontal(id="ej-header"):
                 yield Static("[b]Edit Embedded JSON[/b]", id="ej-title")
@@ -169,14 +177,19 @@ class JsonEditorApp(App):
         # EJ editor: 부모 문서 갱신
         if self._is_ej_editor_focused() and self._ej_stack:
             row, col_start, col_end, prev_content, _ = self._ej_stack[-1]
+            content = event.content
             try:
-                parsed = json.loads(event.content)
-                minified = json.dumps(parsed, ensure_ascii=False)
+                if "\n" not in content and content.strip() == content:
+                    # 이미 한 줄이면 검증만 하고 파싱/직렬화 왕복 생략
+                    validate_json(content)
+                    minified = content
+                else:
+                    minified = dumps_compact(json_loads(content))
             except json.JSONDecodeError:
                 self.notify("Invalid JSON", severity="error")
                 return
 
-            escaped = json.dumps(minified, ensure_ascii=False)
+            escaped = dumps_compact(minified)
             new_col_end = col_start + len(escaped)
 
             if event.quit_after:
@@ -269,7 +282,12 @@ class JsonEditorApp(App):
         help_panel = self.query_one("#help-panel")
         help_panel.toggle_class("visible")
         if help_panel.has_class("visible"):
-            self.query_one("#help-editor").focus()
+            if self._help_editor is None:
+                self._help_editor = JsonEditor(
+                    _load_data("help.json"), read_only=True, id="help-editor"
+                )
+                help_panel.mount(self._help_editor)
+            self._help_editor.focus()
         else:
             self.query_one("#editor").focus()
 
@@ -285,15 +303,30 @@ class JsonEditorApp(App):
         if not self._ej_stack:
             return False
         ej_editor = self.query_one("#ej-editor", JsonEditor)
-        current = ej_editor.get_content()
         _, _, _, _, original = self._ej_stack[-1]
-        return current != original
+        # 키 입력마다 호출되므로 버퍼 버전이 그대로면 get_content() 생략
+        lines, version = ej_editor.lines, ej_editor._lines_version
+        cache = self._ej_dirty_cache
+        if (
+            cache is not None
+            and cache[0] is lines
+            and cache[1] == version
+            and cache[2] is original
+        ):
+            return cache[3]
+        dirty = ej_editor.get_content() != original
+        self._ej_dirty_cache = (lines, version, original, dirty)
+        return dirty
 
     def _update_ej_title(self) -> None:
         """Update ej panel title with current nesting level and modified indicator."""
         level = len(self._ej_stack)
+        dirty = self._ej_has_unsaved_changes()
+        if (level, dirty) == self._ej_title_state:
+            return
+        self._ej_title_state = (level, dirty)
         title = self.query_one("#ej-title", Static)
-        modified = " [+]" if self._ej_has_unsaved_changes() else ""
+        modified = " [+]" if dirty else ""
         title.update(f"[b]Edit Embedded JSON[/b] [dim](level {level}){modified}[/dim]")
 
     def _close_ej_panel(self) -> None:
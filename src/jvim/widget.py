@@ -2,23 +2,86 @@
 
 from __future__ import annotations
 
+import io
 import json
 import re
 import unicodedata
+from array import array
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum, auto
+from itertools import accumulate
+from operator import itemgetter
 
-from rich.text import Text
+from rich.text import Span, Text
 from textual import events
 from textual.message import Message
 from textual.reactive import reactive
 from textual.widget import Widget
 
 from jvim._fold import FoldMixin
+from jvim._jsonio import dumps_compact, dumps_pretty
+from jvim._jsonio import loads as json_loads
+from jvim._jsonio import validate as validate_json
 from jvim._search import SearchMixin
 from jvim._substitute import SubstituteMixin
+from jvim._tokenize import (
+    STYLE_NAMES,
+    compute_line_styles,
+    compute_style_ids,
+    style_id_runs,
+)
 from jvim._visual import VisualMixin
 
+# 문자 → 표시 폭 캐시 (모든 에디터 인스턴스가 공유)
+_WIDTH_CACHE: dict[str, int] = {}
+# (line, avail) → 비ASCII 라인의 wrap 세그먼트. 가장 오래된 항목부터 제거
+_SEGMENT_CACHE: dict[tuple[str, int], list[tuple[int, int]]] = {}
+_SEGMENT_CACHE_MAX = 4096
+# 같은 키 → 마지막 세그먼트의 표시 폭 (세그먼트 캐시와 함께 추가/제거)
+_TAIL_WIDTH_CACHE: dict[tuple[str, int], int] = {}
+# 렌더 overlay 스타일 id: syntax id(STYLE_NAMES) 뒤에 이어서 같은 bytearray에 기록
+_STYLE_VISUAL = len(STYLE_NAMES)
+_STYLE_MATCH_CURRENT = _STYLE_VISUAL + 1
+_STYLE_MATCH = _STYLE_VISUAL + 2
+_STYLE_DIM_ITALIC = _STYLE_VISUAL + 3
+_RENDER_STYLE_NAMES = (
+    *STYLE_NAMES,
+    "on dark_blue",
+    "black on yellow",
+    "black on dark_goldenrod",
+    "dim italic",
+)
+# line background → 배경을 접두어로 붙인 스타일 이름 표 (visual/search 제외)
+_BG_STYLE_NAMES: dict[str, tuple[str, ...]] = {}
+# 이 크기(문자 수) 이상의 JSONL :fmt는 워커 스레드에서 파싱
+_THREADED_FORMAT_MIN = 1_000_000
+
+
+def _display_width(ch: str) -> int:
+    """Return display width of a character (2 for fullwidth/wide)."""
+    if ch < "\u0100":
+        return 1
+    w = _WIDTH_CACHE.get(ch)
+    if w is None:
+        w = 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+        _WIDTH_CACHE[ch] = w
+    return w
+
+
+def _bg_style_names(line_bg: str) -> tuple[str, ...]:
+    """Return ``_RENDER_STYLE_NAMES`` with *line_bg* applied (cached)."""
+    names = tuple(
+        name
+        if sid in (_STYLE_VISUAL, _STYLE_MATCH_CURRENT, _STYLE_MATCH)
+        else f"{line_bg} {name}"
+        for sid, name in enumerate(_RENDER_STYLE_NAMES)
+    )
+    _BG_STYLE_NAMES[line_bg] = names
+    return names
+
 
 class EditorMode(Enum):
     NORMAL = auto()
@@ -106,16 +169,24 @@ class JsonEditor(
         self.read_only: bool = read_only
         self.jsonl: bool = jsonl
         if self.jsonl and initial_content:
-            initial_content = self._jsonl_to_pretty(initial_content)
-        self.lines: list[str] = initial_content.split("\n") if initial_content else [""]
+            # 중간 문자열 없이 라인 리스트로 바로 변환
+            lines = list(self._jsonl_to_pretty_lines(initial_content))
+        else:
+            lines = initial_content.split("\n") if initial_content else []
+        self.lines: list[str] = lines or [""]
         self.cursor_row: int = 0
         self.cursor_col: int = 0
         self._mode: EditorMode = EditorMode.NORMAL
         self.command_buffer: str = ""
         self.pending: str = ""
         self.status_msg: str = ""
-        self.undo_stack: list[tuple[list[str], int, int]] = []
-        self.redo_stack: list[tuple[list[str], int, int]] = []
+        # (start, tail, old_lines, row, col): lines[start:len-tail] 구간 스냅샷
+        self.undo_stack: deque[tuple[int, int, list[str], int, int]] = deque(
+            maxlen=self._UNDO_MAX
+        )
+        self.redo_stack: deque[tuple[int, int, list[str], int, int]] = deque(
+            maxlen=self._UNDO_MAX
+        )
         self.yank_buffer: list[str] = []
         self._scroll_top: int = 0
         self._dot_buffer: list[tuple[str, str | None]] = []
@@ -132,6 +203,15 @@ class JsonEditor(
             int, list[tuple[int, int, int]]
         ] = {}  # Fast lookup
         self._current_match: int = -1  # Index in _search_matches
+        # 매치가 (row, col) 순이면 커서 근처 매치를 이분 탐색
+        self._search_matches_sorted: bool = True
+        # (lines, _lines_version, (pattern, flags), matches, match_by_row)
+        self._search_cache: tuple | None = None
+        # (lines, _lines_version, 값): JSONPath 검색/치환용 키 인덱스와 블록 시작 줄
+        self._key_index_cache: tuple | None = None
+        self._block_starts_cache: tuple | None = None
+        # (lines, _lines_version, JSONL 블록별 파싱 결과)
+        self._jsonl_parsed_cache: tuple | None = None
         self._search_history: list[str] = []  # Previous search patterns
         self._search_history_idx: int = (
             -1
@@ -142,10 +222,26 @@ class JsonEditor(
         self._command_history_idx: int = -1  # Current position in history
         self._command_history_max: int = 50  # Max history size
         # Render caches
-        self._style_cache: dict[int, list[str]] = {}
+        # 행 번호 → (원본 라인, 값): 라인 텍스트가 같으면 편집 후에도 재사용
+        self._style_cache: dict[int, tuple[str, bytearray]] = {}
+        self._run_cache: dict[int, tuple[str, list[tuple[int, int, str]]]] = {}
+        # 행 번호 → (원본 라인, avail, 세그먼트별 렌더 Text): overlay 없는 행 전용
+        self._seg_text_cache: dict[
+            int, tuple[str, int, list[list[tuple[str, str]]]]
+        ] = {}
         self._cache_dirty: bool = False
-        self._jsonl_records_cache: list[int] | None = None
-        self._char_width_cache: dict[str, int] = {}
+        self._lines_version: int = 0  # _invalidate_caches마다 증가
+        self._render_sig: tuple | None = None
+        self._last_rendered: Text | None = None
+        self._content_cache: tuple[list[str], int, str] | None = None
+        self._line_starts_cache: tuple[list[str], int, array[int]] | None = None
+        # (JSONL 레코드 맵, 레코드 번호 열 너비)
+        self._gutter_cache: tuple[list[int], int] | None = None
+        self._pending_refresh: bool = False  # 너무 작아서 미룬 refresh
+        # 마지막 :fmt 직후의 (lines, _lines_version)
+        self._formatted_state: tuple[list[str], int] | None = None
+        self._jsonl_records_cache: array[int] | None = None
+        self._char_width_cache: dict[str, int] = _WIDTH_CACHE
         # Fold state
         self._folds: dict[int, int] = {}  # {fold_header_line: fold_end_line}
         self._collapsed_strings: set[int] = set()  # 접힌 긴 string 라인
@@ -167,6 +263,8 @@ class JsonEditor(
     def _invalidate_caches(self) -> None:
         """Invalidate render caches when content changes."""
         self._cache_dirty = True
+        self._lines_version += 1
+        self._jsonl_records_cache = None
 
     def _check_readonly(self) -> bool:
         """Check if read-only and set status. Returns True if read-only."""
@@ -200,15 +298,63 @@ class JsonEditor(
             self._clamp_cursor()
         self._dot_replaying = False
 
-    def _save_undo(self) -> None:
-        self.undo_stack.append((self.lines[:], self.cursor_row, self.cursor_col))
-        if len(self.undo_stack) > 200:
-            self.undo_stack.pop(0)
+    def _save_undo(self, start: int = 0, end: int | None = None) -> None:
+        """Snapshot ``lines[start:end]`` before an edit touching only that range.
+
+        Lines outside the range must stay unchanged (rows may be inserted or
+        removed inside it).  With no arguments the whole buffer is saved.
+        """
+        lines = self.lines
+        if end is None:
+            end = len(lines)
+        self.undo_stack.append(
+            (
+                start,
+                len(lines) - end,
+                lines[start:end],
+                self.cursor_row,
+                self.cursor_col,
+            )
+        )
         # Clear redo stack on new edit
         if self.redo_stack:
             self.redo_stack.clear()
         self._invalidate_caches()
 
+    def _mutate(self, start: int, end: int, new_lines: list[str]) -> None:
+        """Replace ``lines[start:end]`` with *new_lines*, recording undo."""
+        # 빈 줄/비어있지 않은 줄 구성이 같으면 JSONL 레코드 맵은 그대로 유효,
+        # 다르면 수정 구간부터만 다시 계산
+        records = self._jsonl_records_cache
+        if records is not None and not (
+            len(new_lines) == end - start
+            and all(
+                (not old or old.isspace()) == (not new or new.isspace())
+                for old, new in zip(self.lines[start:end], new_lines)
+            )
+        ):
+            records = self._patch_jsonl_records(records, start, end, new_lines)
+        self._save_undo(start, end)
+        self.lines[start:end] = new_lines
+        self._jsonl_records_cache = records
+
+    def _line_starts(self) -> array[int]:
+        """Offset of each line start in ``get_content()`` (plus one past the end)."""
+        lines = self.lines
+        cached = self._line_starts_cache
+        if cached and cached[0] is lines and cached[1] == self._lines_version:
+            return cached[2]
+        # 각 줄 길이 + 개행 1의 누적합 (C 레벨 accumulate)
+        starts = array("i", accumulate(map((1).__add__, map(len, lines)), initial=0))
+        self._line_starts_cache = (lines, self._lines_version, starts)
+        return starts
+
+    def _offset_to_pos(self, offset: int) -> tuple[int, int]:
+        """Convert an offset in ``get_content()`` to ``(row, col)``."""
+        starts = self._line_starts()
+        row = bisect_right(starts, offset) - 1
+        return row, offset - starts[row]
+
     def _clamp_cursor(self) -> None:
         self.cursor_row = max(0, min(self.cursor_row, len(self.lines) - 1))
         # fold 안이면 fold 헤더로 snap
@@ -240,46 +386,83 @@ class JsonEditor(
             max_col = line_len
         self.cursor_col = max(0, min(self.cursor_col, max_col))
 
-    def _char_width(self, ch: str) -> int:
-        """Return display width of a character (2 for fullwidth/wide)."""
-        if ch < "\u0100":
-            return 1
-        w = self._char_width_cache.get(ch)
-        if w is None:
-            w = 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
-            self._char_width_cache[ch] = w
-        return w
+    _char_width = staticmethod(_display_width)
 
     def _make_segments(self, line: str, avail: int) -> list[tuple[int, int]]:
-        """Break *line* into segments fitting within *avail* display columns."""
+        """Break *line* into segments fitting within *avail* display columns.
+
+        The returned list may be shared through a cache; callers must not
+        mutate it.
+        """
         if not line:
             return [(0, 0)]
         if line.isascii():
             return [(s, min(s + avail, len(line))) for s in range(0, len(line), avail)]
-        segs: list[tuple[int, int]] = []
-        seg_start = 0
-        w = 0
-        for i, ch in enumerate(line):
-            cw = self._char_width(ch)
-            if w + cw > avail and i > seg_start:
-                segs.append((seg_start, i))
-                seg_start = i
-                w = cw
-            else:
-                w += cw
-        segs.append((seg_start, len(line)))
+        key = (line, avail)
+        segs = _SEGMENT_CACHE.get(key)
+        if segs is None:
+            segs = self._wide_segments(line, avail)
+            if len(_SEGMENT_CACHE) >= _SEGMENT_CACHE_MAX:
+                oldest = next(iter(_SEGMENT_CACHE))
+                del _SEGMENT_CACHE[oldest]
+                del _TAIL_WIDTH_CACHE[oldest]
+            _SEGMENT_CACHE[key] = segs
+            # _wide_segments가 _WIDTH_CACHE를 채워 두었으므로 조회만 한다
+            _TAIL_WIDTH_CACHE[key] = sum(
+                map(_WIDTH_CACHE.__getitem__, line[segs[-1][0] :])
+            )
         return segs
 
+    def _tail_width(self, line: str, avail: int) -> int:
+        """Return the display width of the last wrapped segment of *line*."""
+        n = len(line)
+        if line.isascii():
+            return n - (-(-n // avail) - 1) * avail if n else 0
+        key = (line, avail)
+        width = _TAIL_WIDTH_CACHE.get(key)
+        if width is None:
+            self._make_segments(line, avail)
+            width = _TAIL_WIDTH_CACHE[key]
+        return width
+
+    @staticmethod
+    def _wide_segments(line: str, avail: int) -> list[tuple[int, int]]:
+        """Width-aware segmentation for lines containing non-ASCII characters."""
+        # 처음 보는 문자만 폭을 계산해 두면 누적 폭은 C 레벨에서 구할 수 있다
+        widths = _WIDTH_CACHE
+        for ch in set(line).difference(widths):
+            widths[ch] = _display_width(ch)
+        cum = list(accumulate(map(widths.__getitem__, line)))
+        n = len(line)
+        segs: list[tuple[int, int]] = []
+        start = 0
+        base = 0
+        while True:
+            # 누적 폭이 base + avail 이하인 마지막 문자까지 (최소 1문자)
+            end = bisect_right(cum, base + avail, start)
+            if end == start:
+                end += 1
+            if end >= n:
+                segs.append((start, n))
+                return segs
+            segs.append((start, end))
+            base = cum[end - 1]
+            start = end
+
     def _wrap_rows(self, line: str, avail: int) -> int:
         """Return the number of display rows a line occupies when wrapped."""
         if not line:
             return 1
         if line.isascii():
             return -(-len(line) // avail)
+        if avail >= 2:
+            # 문자 폭이 최대 2이므로 세그먼트 수와 같다 (캐시 공유)
+            return len(self._make_segments(line, avail))
+        char_width = _display_width
         rows = 1
         w = 0
         for ch in line:
-            cw = self._char_width(ch)
+            cw = char_width(ch)
             if w + cw > avail:
                 rows += 1
                 w = cw
@@ -289,16 +472,23 @@ class JsonEditor(
 
     def _cursor_wrap_dy(self, line: str, cursor_col: int, avail: int) -> int:
         """Return the wrapped row index (0-based) of *cursor_col* within *line*."""
+        if line.isascii():
+            # 모든 문자 폭이 1: 세그먼트 없이 산술로 계산
+            n = len(line)
+            if cursor_col < n:
+                return cursor_col // avail
+            if not n:
+                return 0
+            rows = -(-n // avail)
+            return rows if n - (rows - 1) * avail + 1 > avail else rows - 1
         segs = self._make_segments(line, avail)
-        for si, (s_start, s_end) in enumerate(segs):
-            if cursor_col < s_end:
-                return si
+        # 세그먼트 끝은 증가 순: cursor_col < s_end인 첫 세그먼트를 이진 탐색
+        si = bisect_right(segs, cursor_col, key=itemgetter(1))
+        if si < len(segs):
+            return si
         # cursor at end of line — check if cursor block fits on last row
-        if line:
-            ls, le = segs[-1]
-            last_w = sum(self._char_width(line[c]) for c in range(ls, le))
-            if last_w + 1 > avail:
-                return len(segs)
+        if line and self._tail_width(line, avail) + 1 > avail:
+            return len(segs)
         return max(0, len(segs) - 1)
 
     def _gutter_widths(self) -> tuple[int, int, int]:
@@ -309,25 +499,26 @@ class JsonEditor(
         ln_width = max(3, len(str(len(self.lines))))
         if not self.jsonl:
             return ln_width, 0, ln_width + 1
-        rec_count = 0
-        in_block = False
-        for line in self.lines:
-            if line.strip():
-                if not in_block:
-                    rec_count += 1
-                    in_block = True
-            else:
-                in_block = False
-        rec_width = max(2, len(str(max(1, rec_count))))
+        records = self._current_jsonl_records()
+        cached = self._gutter_cache
+        if cached is not None and cached[0] is records:
+            rec_width = cached[1]
+        else:
+            # 마지막 레코드 번호 = 전체 레코드 수. 마지막 레코드가 길면 역방향
+            # 탐색도 길어지므로 레코드 맵 객체별로 한 번만 계산
+            rec_count = next((rec for rec in reversed(records) if rec), 0)
+            rec_width = max(2, len(str(max(1, rec_count))))
+            self._gutter_cache = (records, rec_width)
         return ln_width, rec_width, rec_width + 1 + ln_width + 1
 
-    def _jsonl_line_records(self) -> list[int]:
+    def _jsonl_line_records(self) -> array[int]:
         """Map each editor line to its JSONL record number.
 
         The first line of each block gets the 1-based record number;
         all other lines (continuation / blank separator) get 0.
         """
-        result = [0] * len(self.lines)
+        # 줄마다 boxed int 대신 C int 배열 (줄 수만큼의 큰 맵)
+        result = array("i", bytes(4 * len(self.lines)))
         record = 0
         in_block = False
         for i, line in enumerate(self.lines):
@@ -340,6 +531,59 @@ class JsonEditor(
                 in_block = False
         return result
 
+    def _patch_jsonl_records(
+        self, records: array[int], start: int, end: int, new_lines: list[str]
+    ) -> array[int]:
+        """Return *records* updated for ``lines[start:end] = new_lines``.
+
+        Must be called before the lines are replaced.  Only the edited rows
+        and the row right after them are re-evaluated; later record numbers
+        are shifted by the change in record count.
+        """
+        lines = self.lines
+
+        def count_through(recs: array[int], row: int) -> int:
+            # row까지(포함) 시작된 레코드 수 = 마지막 0이 아닌 번호
+            while row >= 0 and not recs[row]:
+                row -= 1
+            return recs[row] if row >= 0 else 0
+
+        record = count_through(records, start - 1)
+        prev = lines[start - 1] if start else ""
+        in_block = bool(prev) and not prev.isspace()
+        patch = array("i")
+        tail = end
+        # 수정 구간 + 바로 다음 줄 (블록 시작 여부가 바뀔 수 있음)
+        rows = new_lines if end >= len(lines) else [*new_lines, lines[end]]
+        if end < len(lines):
+            tail += 1
+        for line in rows:
+            if line and not line.isspace():
+                if in_block:
+                    patch.append(0)
+                else:
+                    record += 1
+                    patch.append(record)
+                    in_block = True
+            else:
+                patch.append(0)
+                in_block = False
+        delta = record - count_through(records, tail - 1)
+        rest = records[tail:]
+        if delta:
+            rest = array("i", [r + delta if r else 0 for r in rest])
+        return records[:start] + patch + rest
+
+    def _current_jsonl_records(self) -> array[int]:
+        """Return the line → record map, reusing the render cache when fresh."""
+        records = self._jsonl_records_cache
+        if records is None:
+            records = self._jsonl_line_records()
+            # 편집 도중(렌더 전)에 만든 맵은 저장하지 않음
+            if not self._cache_dirty:
+                self._jsonl_records_cache = records
+        return records
+
     def _visible_height(self) -> int:
         return max(1, self.content_region.height - 2)
 
@@ -360,12 +604,21 @@ class JsonEditor(
         wrap_rows = self._wrap_rows
         lines = self.lines
         is_folded = self._is_line_folded if self._folds else None
-        rows_before = sum(
-            wrap_rows(lines[i], avail)
-            for i in range(self._scroll_top, self.cursor_row)
-            if not (is_folded and is_folded(i))
-        )
         cursor_dy = self._cursor_wrap_dy(lines[self.cursor_row], self.cursor_col, avail)
+        # 커서에서 위로 합산하다 base_vh를 넘으면 중단: 그보다 위 라인은
+        # scroll_top이 될 수 없으므로 합산은 O(화면 높이)로 끝난다
+        top = self.cursor_row
+        rows_before = 0
+        while top > self._scroll_top:
+            i = top - 1
+            rows = 0 if is_folded and is_folded(i) else wrap_rows(lines[i], avail)
+            if rows_before + rows + cursor_dy >= base_vh:
+                break
+            rows_before += rows
+            top = i
+        if top != self._scroll_top:
+            self._scroll_top = top
+            vh = _effective_vh(top)
         while rows_before + cursor_dy >= vh and self._scroll_top <= self.cursor_row:
             if not (is_folded and is_folded(self._scroll_top)):
                 rows_before -= wrap_rows(lines[self._scroll_top], avail)
@@ -385,14 +638,25 @@ class JsonEditor(
     # -- Public API --------------------------------------------------------
 
     def get_content(self) -> str:
-        return "\n".join(self.lines)
+        # lines 객체와 _lines_version이 같으면 이전 join 결과 재사용
+        lines = self.lines
+        cached = self._content_cache
+        if cached and cached[0] is lines and cached[1] == self._lines_version:
+            return cached[2]
+        content = "\n".join(lines)
+        self._content_cache = (lines, self._lines_version, content)
+        return content
 
     def set_content(self, content: str) -> None:
         if self.jsonl and content:
-            content = self._jsonl_to_pretty(content)
-        self.lines = content.split("\n") if content else [""]
+            self.lines = list(self._jsonl_to_pretty_lines(content)) or [""]
+        else:
+            self.lines = content.split("\n") if content else [""]
         self.cursor_row = 0
         self.cursor_col = 0
+        # 새 버퍼: 구간 단위 undo 기록은 이전 내용 기준이므로 폐기
+        self.undo_stack.clear()
+        self.redo_stack.clear()
         self._folds.clear()
         self._collapsed_strings.clear()
         # 초기 로드 시 긴 문자열 자동 접기
@@ -424,28 +688,61 @@ class JsonEditor(
         """서브클래스에서 라인별 배경 스타일을 지정하기 위한 훅."""
         return ""
 
+    def _render_signature(self, width: int, height: int) -> tuple:
+        """render() 결과에 영향을 주는 상태 요약. 이전과 같으면 재렌더 불필요."""
+        return (
+            width,
+            height,
+            self.lines,
+            self._lines_version,
+            self.cursor_row,
+            self.cursor_col,
+            self._scroll_top,
+            self._mode,
+            self.pending,
+            self.status_msg,
+            self.command_buffer,
+            self._search_buffer,
+            self._search_forward,
+            self._search_match_by_row,
+            self._current_match,
+            self._visual_mode,
+            self._visual_anchor_row,
+            self._visual_anchor_col,
+            tuple(self._folds.items()),
+            frozenset(self._collapsed_strings),
+            self.read_only,
+            self.jsonl,
+        )
+
     def render(self) -> Text:
         width = self.content_region.width
         height = self.content_region.height
         if height < 3 or width < 10:
             return Text("(too small)")
 
-        # Flush caches when content changed
+        # 변화 없는 refresh는 이전 결과 재사용
+        if (
+            self._last_rendered is not None
+            and self._render_signature(width, height) == self._render_sig
+        ):
+            return self._last_rendered
+
+        # Flush caches when content changed.  Style/run entries are validated
+        # against the line text on lookup, so only rows past EOF are dropped.
         if self._cache_dirty:
-            self._style_cache.clear()
-            self._jsonl_records_cache = None
+            n_lines = len(self.lines)
+            for cache in (self._style_cache, self._run_cache, self._seg_text_cache):
+                if len(cache) > n_lines:
+                    for row in [r for r in cache if r >= n_lines]:
+                        del cache[row]
             self._cache_dirty = False
 
         content_height = height - 2
         ln_width, rec_width, prefix_w = self._gutter_widths()
         avail = max(1, width - prefix_w)
         # Use cached JSONL records
-        if self.jsonl:
-            if self._jsonl_records_cache is None:
-                self._jsonl_records_cache = self._jsonl_line_records()
-            jsonl_records = self._jsonl_records_cache
-        else:
-            jsonl_records = None
+        jsonl_records = self._current_jsonl_records() if self.jsonl else None
 
         self._ensure_cursor_visible(avail)
 
@@ -454,13 +751,23 @@ class JsonEditor(
         cursor_row = self.cursor_row
         cursor_col = self.cursor_col
         make_segments = self._make_segments
-        char_width = self._char_width
+        tail_width = self._tail_width
+        char_width = _display_width
         style_cache = self._style_cache
-        compute_styles = self._compute_line_styles
+        run_cache = self._run_cache
+        seg_text_cache = self._seg_text_cache
+        render_names = _RENDER_STYLE_NAMES
         search_by_row = self._search_match_by_row
-        result_append = Text.append
-
-        result = Text()
+        current_match = self._current_match
+        line_background = self._line_background
+        segment_texts = self._segment_texts
+        visual_mode = self._visual_mode
+        if visual_mode:
+            vsr, vsc, ver, vec = self._visual_selection_range()
+
+        # (text, style) 조각을 모아 마지막에 Text 하나로 조립
+        pieces: list[tuple[str, str]] = []
+        emit = pieces.append
         rows_used = 0
         line_idx = self._scroll_top
         num_lines = len(lines)
@@ -480,8 +787,8 @@ class JsonEditor(
                     header = (
                         f"{rec_start_line + 1:>{ln_width}} {rec_num:>{rec_width}} ↓"
                     )
-                    result_append(result, header, style="bold cyan on grey23")
-                    result_append(result, " " * (width - len(header)) + "\n")
+                    emit((header, "bold cyan on grey23"))
+                    emit((" " * (width - len(header)) + "\n", ""))
                     rows_used += 1
 
         folds = self._folds
@@ -509,130 +816,147 @@ class JsonEditor(
                     suffix = f'..." ({slen} chars)'
                     # 접힌 라인: key 부분 + "preview..." (N chars) + trailing
                     collapsed_line = line[:qs] + '"' + preview + suffix + line[qe:]
-                    collapsed_styles = compute_styles(collapsed_line)
+                    collapsed_ids = compute_style_ids(collapsed_line)
                     # suffix 부분을 dim italic으로 변경
                     suffix_start = qs + 1 + preview_len
-                    for ci in range(suffix_start, suffix_start + len(suffix)):
-                        if ci < len(collapsed_styles):
-                            collapsed_styles[ci] = "dim italic"
-                    str_collapse_info = (collapsed_line, collapsed_styles)
+                    collapsed_ids[suffix_start : suffix_start + len(suffix)] = bytes(
+                        (_STYLE_DIM_ITALIC,)
+                    ) * len(suffix)
+                    str_collapse_info = (collapsed_line, collapsed_ids)
 
             if str_collapse_info:
-                line, line_styles = str_collapse_info
+                line, line_ids = str_collapse_info
             else:
-                # Use cached styles or compute
-                if line_idx in style_cache:
-                    line_styles = style_cache[line_idx]
+                # Use cached style ids or compute (stale if the line changed)
+                cached = style_cache.get(line_idx)
+                if cached is not None and cached[0] == line:
+                    line_ids = cached[1]
                 else:
-                    line_styles = compute_styles(line)
-                    style_cache[line_idx] = line_styles
+                    line_ids = compute_style_ids(line)
+                    style_cache[line_idx] = (line, line_ids)
 
             line_len = len(line)
+            line_ascii = line.isascii()
 
             # Break line into width-aware wrapped segments
             segs = make_segments(line, avail)
             # Cursor at end of line may need an extra wrap row
-            if is_cursor_line and cursor_col >= line_len and line:
-                ls, le = segs[-1]
-                last_w = sum(char_width(line[c]) for c in range(ls, le))
-                if last_w + 1 > avail:
-                    segs.append((line_len, line_len))
+            if (
+                is_cursor_line
+                and cursor_col >= line_len
+                and line
+                and tail_width(line, avail) + 1 > avail
+            ):
+                segs = [*segs, (line_len, line_len)]
 
             # 라인 배경 (diff 하이라이팅 등 서브클래스용 훅)
-            line_bg = self._line_background(line_idx)
+            line_bg = line_background(line_idx)
             has_search = search_by_row and line_idx in search_by_row
-            has_visual = bool(self._visual_mode) and line_len > 0
-            # 변이가 필요한 경우에만 복사
+            has_visual = bool(visual_mode) and line_len > 0
+            # overlay는 캐시된 id 버퍼의 복사본에 id로 덮어씀
+            names = render_names
             if line_bg or has_visual or has_search:
-                line_styles = line_styles[:]
+                line_ids = bytearray(line_ids)
                 if line_bg:
-                    for c in range(len(line_styles)):
-                        line_styles[c] = f"{line_bg} {line_styles[c]}"
+                    names = _BG_STYLE_NAMES.get(line_bg) or _bg_style_names(line_bg)
                 # Visual 하이라이트 (search보다 아래 — search가 위에 보이도록)
                 if has_visual:
-                    vsr, vsc, ver, vec = self._visual_selection_range()
-                    if self._visual_mode == "V":
+                    v_start = v_end = 0
+                    if visual_mode == "V":
                         if vsr <= line_idx <= ver:
-                            for c in range(line_len):
-                                line_styles[c] = "on dark_blue"
-                    else:
-                        if vsr == ver == line_idx:
-                            for c in range(vsc, min(vec + 1, line_len)):
-                                line_styles[c] = "on dark_blue"
-                        elif line_idx == vsr:
-                            for c in range(vsc, line_len):
-                                line_styles[c] = "on dark_blue"
-                        elif line_idx == ver:
-                            for c in range(0, min(vec + 1, line_len)):
-                                line_styles[c] = "on dark_blue"
-                        elif vsr < line_idx < ver:
-                            for c in range(line_len):
-                                line_styles[c] = "on dark_blue"
+                            v_end = line_len
+                    elif vsr <= line_idx <= ver:
+                        v_start = vsc if line_idx == vsr else 0
+                        v_end = min(vec + 1, line_len) if line_idx == ver else line_len
+                    if v_end > v_start:
+                        line_ids[v_start:v_end] = bytes((_STYLE_VISUAL,)) * (
+                            v_end - v_start
+                        )
                 if has_search:
                     for m_start, m_end, mi in search_by_row[line_idx]:
-                        is_current = mi == self._current_match
-                        style = (
-                            "black on yellow"
-                            if is_current
-                            else "black on dark_goldenrod"
-                        )
-                        for c in range(m_start, min(m_end, line_len)):
-                            line_styles[c] = style
+                        m_end = min(m_end, line_len)
+                        if m_end > m_start:
+                            sid = (
+                                _STYLE_MATCH_CURRENT
+                                if mi == current_match
+                                else _STYLE_MATCH
+                            )
+                            line_ids[m_start:m_end] = bytes((sid,)) * (m_end - m_start)
 
             # Collapsed string은 1줄만 렌더 (wrap 방지)
             if str_collapse_info:
                 segs = segs[:1]
 
+            # 스타일 run: overlay가 없는 라인은 캐시 재사용
+            seg_texts = None
+            if line_bg or has_visual or has_search or str_collapse_info:
+                runs = style_id_runs(line_ids, names)
+            else:
+                cached = run_cache.get(line_idx)
+                if cached is not None and cached[0] == line:
+                    runs = cached[1]
+                else:
+                    runs = style_id_runs(line_ids)
+                    run_cache[line_idx] = (line, runs)
+                # 커서가 없는 plain 라인은 세그먼트별 Text를 재사용
+                if not is_cursor_line:
+                    cached = seg_text_cache.get(line_idx)
+                    if cached is not None and cached[1] == avail and cached[0] == line:
+                        seg_texts = cached[2]
+                    else:
+                        seg_texts = segment_texts(line, segs, runs)
+                        seg_text_cache[line_idx] = (line, avail, seg_texts)
+
+            ri = 0
             for si, (s_start, s_end) in enumerate(segs):
                 if rows_used >= content_height:
                     break
                 # Line number on first segment, or first visible row (floating line number)
                 if si == 0 or rows_used == 0:
-                    result_append(
-                        result, f"{line_idx + 1:>{ln_width}} ", style="dim cyan"
-                    )
+                    emit((f"{line_idx + 1:>{ln_width}} ", "dim cyan"))
                     if rec_width:
                         rec_num = jsonl_records[line_idx]
                         if rec_num:
-                            result_append(
-                                result, f"{rec_num:>{rec_width}} ", style="dim yellow"
-                            )
+                            emit((f"{rec_num:>{rec_width}} ", "dim yellow"))
                         else:
-                            result_append(result, " " * (rec_width + 1))
+                            emit((" " * (rec_width + 1), ""))
                 else:
-                    result_append(result, gutter_pad)
-                # Render segment — batch consecutive chars with same style
-                col = s_start
+                    emit((gutter_pad, ""))
+                # Render segment — one append per style run, split at cursor
+                col = s_end if seg_texts else s_start
+                if seg_texts:
+                    pieces.extend(seg_texts[si])
                 while col < s_end:
-                    if is_cursor_line and col == cursor_col:
-                        result_append(
-                            result, line[col], style=f"reverse {line_styles[col]}"
-                        )
-                        col += 1
+                    _, r_end, sty = runs[ri]
+                    if r_end <= col:
+                        ri += 1
                         continue
-                    sty = line_styles[col]
-                    end = col + 1
-                    while (
-                        end < s_end
-                        and line_styles[end] == sty
-                        and not (is_cursor_line and end == cursor_col)
-                    ):
-                        end += 1
-                    result_append(result, line[col:end], style=sty)
+                    end = min(s_end, r_end)
+                    if is_cursor_line and col <= cursor_col < end:
+                        if cursor_col > col:
+                            emit((line[col:cursor_col], sty))
+                        emit((line[cursor_col], f"reverse {sty}"))
+                        if end > cursor_col + 1:
+                            emit((line[cursor_col + 1 : end], sty))
+                    else:
+                        emit((line[col:end], sty))
                     col = end
                 # Cursor block at end of line (insert mode)
                 if is_cursor_line and cursor_col >= line_len and si == len(segs) - 1:
-                    result_append(result, " ", style="reverse")
+                    emit((" ", "reverse"))
                 # Fold summary 표시
                 fold_summary_w = 0
                 if is_fold_header and si == 0:
                     hidden = folds[line_idx] - line_idx
                     summary = f" ... ({hidden} lines)"
                     fold_summary_w = len(summary)
-                    result_append(result, summary, style="dim italic")
+                    emit((summary, "dim italic"))
                 # 라인 배경이 있으면 나머지 너비를 배경색으로 채움
                 if line_bg:
-                    seg_w = sum(char_width(line[c]) for c in range(s_start, s_end))
+                    if line_ascii:
+                        seg_w = s_end - s_start
+                    else:
+                        seg_w = sum(map(char_width, line[s_start:s_end]))
                     if (
                         is_cursor_line
                         and cursor_col >= line_len
@@ -641,8 +965,8 @@ class JsonEditor(
                         seg_w += 1
                     pad = avail - seg_w - fold_summary_w
                     if pad > 0:
-                        result_append(result, " " * pad, style=line_bg)
-                result_append(result, "\n")
+                        emit((" " * pad, line_bg))
+                emit(("\n", ""))
                 rows_used += 1
 
             line_idx += 1
@@ -651,7 +975,7 @@ class JsonEditor(
         if rows_used < content_height:
             tilde_line = f"{'~':>{prefix_w - 1}} \n"
             while rows_used < content_height:
-                result_append(result, tilde_line, style="dim blue")
+                emit((tilde_line, "dim blue"))
                 rows_used += 1
 
         # status bar
@@ -662,15 +986,15 @@ class JsonEditor(
         else:
             mode_label = f" {mode.name} "
             mode_style = self._MODE_STYLE[mode]
-        result_append(result, mode_label, style=mode_style)
+        emit((mode_label, mode_style))
 
         read_only = self.read_only
         if read_only:
-            result_append(result, " RO ", style="bold white on grey37")
+            emit((" RO ", "bold white on grey37"))
 
         pending = self.pending
         if pending:
-            result_append(result, f"  {pending}", style="bold yellow")
+            emit((f"  {pending}", "bold yellow"))
 
         status_msg = self.status_msg
         pos = f" Ln {cursor_row + 1}/{num_lines}, Col {cursor_col + 1} "
@@ -678,32 +1002,28 @@ class JsonEditor(
         spacer_len = max(
             0, width - len(mode_label) - ro_len - len(pos) - len(status_msg) - 4
         )
-        result_append(result, f"  {status_msg}")
-        if spacer_len:
-            result_append(result, " " * spacer_len)
-        result_append(result, pos, style="bold")
+        # 상태 메시지와 spacer를 한 번에 추가 (ljust: C 레벨 패딩)
+        emit((f"  {status_msg}".ljust(len(status_msg) + 2 + spacer_len), ""))
+        emit((pos, "bold"))
 
         if mode == EditorMode.COMMAND:
-            result_append(result, f"\n:{self.command_buffer}", style="bold yellow")
-            result_append(result, " ", style="reverse")
+            emit((f"\n:{self.command_buffer}", "bold yellow"))
+            emit((" ", "reverse"))
         elif mode == EditorMode.SEARCH:
             prefix = "/" if self._search_forward else "?"
-            result_append(
-                result, f"\n{prefix}{self._search_buffer}", style="bold magenta"
-            )
-            result_append(result, " ", style="reverse")
+            emit((f"\n{prefix}{self._search_buffer}", "bold magenta"))
+            emit((" ", "reverse"))
         else:
-            result_append(result, "\n")
+            emit(("\n", ""))
 
+        result = self._assemble_text(pieces)
+        self._render_sig = self._render_signature(width, height)
+        self._last_rendered = result
         return result
 
     # -- Syntax colouring helpers ------------------------------------------
 
-    _BRACKET = frozenset("{}[]")
-    _PUNCT = frozenset(":,")
-    _DIGIT = frozenset("0123456789.-+eE")
-    _KEYWORDS = ("true", "false", "null")
-    _KEYWORD_RE = re.compile(r"true|false|null")
+    _UNDO_MAX = 200
     _MODE_STYLE = {
         EditorMode.NORMAL: "bold white on dark_green",
         EditorMode.INSERT: "bold white on dark_blue",
@@ -712,53 +1032,61 @@ class JsonEditor(
     }
     _BRACKET_PAIRS = {"{": "}", "[": "]", "(": ")"}
     _BRACKET_PAIRS_REV = {"}": "{", "]": "[", ")": "("}
+    # 단어 모션 (\w == isalnum() or "_")
+    _WORD_RE = re.compile(r"\w+")
+    _WORD_FWD_RE = re.compile(r"\w*\W*")
+    _WORD_DEL_RE = re.compile(r"\w* *")
 
-    def _compute_line_styles(self, line: str) -> list[str]:
-        """Compute syntax highlight styles for every character in *line*."""
-        n = len(line)
-        if n == 0:
-            return []
+    @staticmethod
+    def _segment_texts(
+        line: str, segs: list[tuple[int, int]], runs: list[tuple[int, int, str]]
+    ) -> list[list[tuple[str, str]]]:
+        """Pre-render each wrapped segment of *line* as ``(text, style)`` pieces."""
+        texts = []
+        ri = 0
+        for s_start, s_end in segs:
+            seg_pieces = []
+            col = s_start
+            while col < s_end:
+                _, r_end, sty = runs[ri]
+                if r_end <= col:
+                    ri += 1
+                    continue
+                end = min(s_end, r_end)
+                seg_pieces.append((line[col:end], sty))
+                col = end
+            texts.append(seg_pieces)
+        return texts
 
-        # Local references for hot path
-        BRACKET = self._BRACKET
-        DIGIT = self._DIGIT
-
-        styles = ["white"] * n
-        is_in_str = [False] * n
-
-        # Single pass: track string regions and first unquoted colon
-        in_str = False
-        first_colon = -1
-        prev_ch = ""
-
-        for i, ch in enumerate(line):
-            if ch == '"' and prev_ch != "\\":
-                in_str = not in_str
-                is_in_str[i] = True
-            elif in_str:
-                is_in_str[i] = True
-            elif ch == ":" and first_colon == -1:
-                first_colon = i
-            prev_ch = ch
-
-        # Assign styles in single pass
-        for i, ch in enumerate(line):
-            if ch in BRACKET:
-                styles[i] = "bold white"
-            elif is_in_str[i]:
-                styles[i] = "cyan" if first_colon == -1 or i < first_colon else "green"
-            elif ch in DIGIT:
-                styles[i] = "yellow"
-            # PUNCT stays "white" (default)
-
-        # Keywords outside strings (single regex pass)
-        for m in self._KEYWORD_RE.finditer(line):
-            ms, me = m.start(), m.end()
-            if not is_in_str[ms]:
-                for j in range(ms, me):
-                    styles[j] = "magenta"
-
-        return styles
+    @staticmethod
+    def _assemble_text(pieces: list[tuple[str, str]]) -> Text:
+        """Build one ``Text`` from ``(text, style)`` pieces with precomputed spans."""
+        spans = []
+        span_append = spans.append
+        pos = 0
+        # 인접한 같은 스타일 조각은 span 하나로 병합
+        run_style = ""
+        run_start = 0
+        for text, style in pieces:
+            if style != run_style:
+                if run_style:
+                    span_append(Span(run_start, pos, run_style))
+                run_style = style
+                run_start = pos
+            pos += len(text)
+        if run_style:
+            span_append(Span(run_start, pos, run_style))
+        plain = "".join([text for text, _ in pieces])
+        result = Text(plain, spans=spans)
+        # Text()가 제어 문자를 제거하면 span 오프셋이 어긋나므로 느린 경로 사용
+        if len(result) != len(plain):
+            result = Text.assemble(*pieces)
+        return result
+
+    @staticmethod
+    def _compute_line_styles(line: str) -> list[str]:
+        """Compute syntax highlight styles for every character in *line*."""
+        return compute_line_styles(line)
 
     # =====================================================================
     # Key handling
@@ -781,7 +1109,24 @@ class JsonEditor(
             self._handle_search(event)
 
         self._clamp_cursor()
-        self.refresh()
+        self._refresh_if_visible()
+
+    def _refresh_if_visible(self) -> None:
+        """렌더 가능한 크기일 때만 refresh. 아니면 다음 resize까지 미룬다."""
+        region = self.content_region
+        if region.height >= 3 and region.width >= 10:
+            # 화면에 영향을 주는 상태가 그대로면 (no-op 키) refresh 생략
+            if self._render_sig is None or self._render_sig != self._render_signature(
+                region.width, region.height
+            ):
+                self.refresh()
+        else:
+            self._pending_refresh = True
+
+    def on_resize(self, event: events.Resize) -> None:
+        if self._pending_refresh:
+            self._pending_refresh = False
+            self.refresh()
 
     # -- NORMAL ------------------------------------------------------------
 
@@ -828,87 +1173,12 @@ class JsonEditor(
                 self.status_msg = "-- VISUAL LINE --"
             return
 
-        # movement
-        if char == "h" or key == "left":
-            self.cursor_col -= 1
-        elif char == "j" or key == "down":
-            self.cursor_row = (
-                self._next_visible_line(self.cursor_row, 1)
-                if self._folds
-                else self.cursor_row + 1
-            )
-        elif char == "k" or key == "up":
-            self.cursor_row = (
-                self._next_visible_line(self.cursor_row, -1)
-                if self._folds
-                else self.cursor_row - 1
-            )
-        elif char == "l" or key == "right":
-            self.cursor_col += 1
-        elif char == "w":
-            self._move_word_forward()
-        elif char == "b":
-            self._move_word_backward()
-        elif char == "0":
-            self.cursor_col = 0
-        elif char == "$" or key == "end":
-            self.cursor_col = max(0, len(self.lines[self.cursor_row]) - 1)
-        elif char == "^" or key == "home":
-            line = self.lines[self.cursor_row]
-            self.cursor_col = len(line) - len(line.lstrip())
-        elif char == "G":
-            self.cursor_row = len(self.lines) - 1
-            self._scroll_cursor_to_top()
-        elif char == "%":
-            self._jump_matching_bracket()
-        elif key == "pagedown" or key == "ctrl+f":
-            if self._folds:
-                self.cursor_row = self._skip_visible_lines(
-                    self.cursor_row, self._visible_height(), 1
-                )
-            else:
-                self.cursor_row += self._visible_height()
-        elif key == "pageup" or key == "ctrl+b":
-            if self._folds:
-                self.cursor_row = self._skip_visible_lines(
-                    self.cursor_row, self._visible_height(), -1
-                )
-            else:
-                self.cursor_row -= self._visible_height()
-        elif key == "ctrl+d":
-            if self._folds:
-                self.cursor_row = self._skip_visible_lines(
-                    self.cursor_row, self._visible_height() // 2, 1
-                )
-            else:
-                self.cursor_row += self._visible_height() // 2
-        elif key == "ctrl+u":
-            if self._folds:
-                self.cursor_row = self._skip_visible_lines(
-                    self.cursor_row, self._visible_height() // 2, -1
-                )
-            else:
-                self.cursor_row -= self._visible_height() // 2
-        elif key == "ctrl+e":
-            nxt = (
-                self._next_visible_line(self._scroll_top, 1)
-                if self._folds
-                else self._scroll_top + 1
-            )
-            self._scroll_top = min(nxt, len(self.lines) - 1)
-        elif key == "ctrl+y":
-            prev = (
-                self._next_visible_line(self._scroll_top, -1)
-                if self._folds
-                else self._scroll_top - 1
-            )
-            self._scroll_top = max(prev, 0)
-        elif key == "ctrl+g":
-            total = len(self.lines)
-            pct = (self.cursor_row + 1) * 100 // total if total else 0
-            self.status_msg = (
-                f'"{self._mode.name}" line {self.cursor_row + 1} of {total} --{pct}%--'
-            )
+        # movement: 단순 모션은 dispatch 테이블로 바로 찾는다
+        motion = self._NORMAL_CHAR_MOTIONS.get(char) or self._NORMAL_KEY_MOTIONS.get(
+            key
+        )
+        if motion is not None:
+            motion(self)
 
         # enter insert mode
         elif char == "i":
@@ -936,13 +1206,13 @@ class JsonEditor(
                 self.status_msg = "[readonly]"
             else:
                 self._dot_start(event)
-                self._save_undo()
                 indent = self._current_indent()
                 before = self.lines[self.cursor_row].rstrip()
                 extra = "    " if before.endswith(("{", "[")) else ""
-                self.cursor_row += 1
-                self.lines.insert(self.cursor_row, " " * indent + extra)
-                self._adjust_line_indices(self.cursor_row, 1)
+                row = self.cursor_row + 1
+                self._mutate(row, row, [" " * indent + extra])
+                self._adjust_line_indices(row, 1)
+                self.cursor_row = row
                 self.cursor_col = indent + len(extra)
                 self._enter_insert()
         elif char == "O":
@@ -950,9 +1220,8 @@ class JsonEditor(
                 self.status_msg = "[readonly]"
             else:
                 self._dot_start(event)
-                self._save_undo()
                 indent = self._current_indent()
-                self.lines.insert(self.cursor_row, " " * indent)
+                self._mutate(self.cursor_row, self.cursor_row, [" " * indent])
                 self._adjust_line_indices(self.cursor_row, 1)
                 self.cursor_col = indent
                 self._enter_insert()
@@ -964,12 +1233,11 @@ class JsonEditor(
             else:
                 self._dot_start(event)
                 self._dot_stop()
-                self._save_undo()
-                line = self.lines[self.cursor_row]
-                if line and self.cursor_col < len(line):
-                    self.lines[self.cursor_row] = (
-                        line[: self.cursor_col] + line[self.cursor_col + 1 :]
-                    )
+                row, col = self.cursor_row, self.cursor_col
+                line = self.lines[row]
+                if line and col < len(line):
+                    line = line[:col] + line[col + 1 :]
+                self._mutate(row, row + 1, [line])
         elif char == "p":
             if self.read_only:
                 self.status_msg = "[readonly]"
@@ -1062,51 +1330,45 @@ class JsonEditor(
             return
 
         if combo == "dd":
-            self._save_undo()
+            row = self.cursor_row
             self._yank_type = "line"
-            self.yank_buffer = [self.lines[self.cursor_row]]
+            self.yank_buffer = [self.lines[row]]
             if len(self.lines) > 1:
-                deleted_at = self.cursor_row
-                self.lines.pop(self.cursor_row)
-                self._adjust_line_indices(deleted_at, -1)
+                self._mutate(row, row + 1, [])
+                self._adjust_line_indices(row, -1)
                 if self.cursor_row >= len(self.lines):
                     self.cursor_row = len(self.lines) - 1
             else:
-                self.lines[0] = ""
+                self._mutate(0, 1, [""])
             self.cursor_col = 0
             self.status_msg = "line deleted"
             self._dot_stop()
 
         elif combo == "dw":
-            self._save_undo()
             self._delete_word()
             self._dot_stop()
 
         elif combo == "d$":
-            self._save_undo()
-            line = self.lines[self.cursor_row]
-            self.lines[self.cursor_row] = line[: self.cursor_col]
+            row = self.cursor_row
+            self._mutate(row, row + 1, [self.lines[row][: self.cursor_col]])
             self._dot_stop()
 
         elif combo == "d0":
-            self._save_undo()
-            line = self.lines[self.cursor_row]
-            self.lines[self.cursor_row] = line[self.cursor_col :]
+            row = self.cursor_row
+            self._mutate(row, row + 1, [self.lines[row][self.cursor_col :]])
             self.cursor_col = 0
             self._dot_stop()
 
         elif combo == "cw":
-            self._save_undo()
             self._delete_word()
             self._enter_insert()
             # recording continues into insert mode
 
         elif combo == "cc":
-            self._save_undo()
             self._yank_type = "line"
             indent = self._current_indent()
             self.yank_buffer = [self.lines[self.cursor_row]]
-            self.lines[self.cursor_row] = " " * indent
+            self._mutate(self.cursor_row, self.cursor_row + 1, [" " * indent])
             self.cursor_col = indent
             self._enter_insert()
             # recording continues into insert mode
@@ -1122,12 +1384,11 @@ class JsonEditor(
             self._scroll_cursor_to_top()
 
         elif len(combo) == 2 and combo[0] == "r":
-            self._save_undo()
-            line = self.lines[self.cursor_row]
-            if self.cursor_col < len(line):
-                self.lines[self.cursor_row] = (
-                    line[: self.cursor_col] + combo[1] + line[self.cursor_col + 1 :]
-                )
+            row, col = self.cursor_row, self.cursor_col
+            line = self.lines[row]
+            if col < len(line):
+                line = line[:col] + combo[1] + line[col + 1 :]
+            self._mutate(row, row + 1, [line])
             self._dot_stop()
 
         elif combo == "ej":
@@ -1163,59 +1424,48 @@ class JsonEditor(
             return
 
         if key == "backspace":
-            self._save_undo()
-            if self.cursor_col > 0:
-                line = self.lines[self.cursor_row]
-                self.lines[self.cursor_row] = (
-                    line[: self.cursor_col - 1] + line[self.cursor_col :]
-                )
+            row, col = self.cursor_row, self.cursor_col
+            if col > 0:
+                line = self.lines[row]
+                self._mutate(row, row + 1, [line[: col - 1] + line[col:]])
                 self.cursor_col -= 1
-            elif self.cursor_row > 0:
-                prev = self.lines[self.cursor_row - 1]
-                self.cursor_col = len(prev)
-                self.lines[self.cursor_row - 1] = prev + self.lines[self.cursor_row]
-                deleted_at = self.cursor_row
-                self.lines.pop(self.cursor_row)
-                self._adjust_line_indices(deleted_at, -1)
+            elif row > 0:
+                prev = self.lines[row - 1]
+                self._mutate(row - 1, row + 1, [prev + self.lines[row]])
+                self._adjust_line_indices(row, -1)
                 self.cursor_row -= 1
+                self.cursor_col = len(prev)
             return
 
         if key == "enter":
-            self._save_undo()
-            line = self.lines[self.cursor_row]
+            row, col = self.cursor_row, self.cursor_col
+            line = self.lines[row]
             indent = len(line) - len(line.lstrip()) if line.strip() else 0
-            before = line[: self.cursor_col].rstrip()
-            after = line[self.cursor_col :].lstrip()
+            before = line[:col].rstrip()
+            after = line[col:].lstrip()
 
             if before.endswith(("{", "[")) and after and after[0] in ("}", "]"):
-                closing_indent = " " * indent
                 new_indent = " " * indent + "    "
-                self.lines[self.cursor_row] = line[: self.cursor_col]
-                self.lines.insert(self.cursor_row + 1, new_indent)
-                self.lines.insert(
-                    self.cursor_row + 2,
-                    closing_indent + line[self.cursor_col :].lstrip(),
+                self._mutate(
+                    row, row + 1, [line[:col], new_indent, " " * indent + after]
                 )
-                self._adjust_line_indices(self.cursor_row + 1, 2)
+                self._adjust_line_indices(row + 1, 2)
                 self.cursor_row += 1
                 self.cursor_col = len(new_indent)
                 return
 
             extra = "    " if before.endswith(("{", "[")) else ""
-            self.lines[self.cursor_row] = line[: self.cursor_col]
-            new_line = " " * indent + extra + line[self.cursor_col :]
+            new_line = " " * indent + extra + line[col:]
+            self._mutate(row, row + 1, [line[:col], new_line])
+            self._adjust_line_indices(row + 1, 1)
             self.cursor_row += 1
-            self.lines.insert(self.cursor_row, new_line)
-            self._adjust_line_indices(self.cursor_row, 1)
             self.cursor_col = indent + len(extra)
             return
 
         if key == "tab":
-            self._save_undo()
-            line = self.lines[self.cursor_row]
-            self.lines[self.cursor_row] = (
-                line[: self.cursor_col] + "    " + line[self.cursor_col :]
-            )
+            row, col = self.cursor_row, self.cursor_col
+            line = self.lines[row]
+            self._mutate(row, row + 1, [line[:col] + "    " + line[col:]])
             self.cursor_col += 4
             return
 
@@ -1236,23 +1486,19 @@ class JsonEditor(
 
         # auto-dedent for closing brackets
         if char in ("}", "]"):
-            self._save_undo()
-            line = self.lines[self.cursor_row]
-            before = line[: self.cursor_col]
+            row, col = self.cursor_row, self.cursor_col
+            line = self.lines[row]
+            before = line[:col]
             if before.strip() == "":
                 new_indent = max(0, len(before) - 4)
-                self.lines[self.cursor_row] = (
-                    " " * new_indent + char + line[self.cursor_col :]
-                )
+                self._mutate(row, row + 1, [" " * new_indent + char + line[col:]])
                 self.cursor_col = new_indent + 1
                 return
 
         if char and char.isprintable():
-            self._save_undo()
-            line = self.lines[self.cursor_row]
-            self.lines[self.cursor_row] = (
-                line[: self.cursor_col] + char + line[self.cursor_col :]
-            )
+            row, col = self.cursor_row, self.cursor_col
+            line = self.lines[row]
+            self._mutate(row, row + 1, [line[:col] + char + line[col:]])
             self.cursor_col += 1
 
     # -- COMMAND -----------------------------------------------------------
@@ -1304,11 +1550,15 @@ class JsonEditor(
         """Add command to history, avoiding duplicates."""
         if not cmd:
             return
-        if cmd in self._command_history:
-            self._command_history.remove(cmd)
-        self._command_history.insert(0, cmd)
-        if len(self._command_history) > self._command_history_max:
-            self._command_history.pop()
+        history = self._command_history
+        if history and history[0] == cmd:
+            return
+        # 중복이면 제거(한 번의 스캔), 아니면 새 항목 자리를 미리 비움
+        try:
+            history.remove(cmd)
+        except ValueError:
+            del history[self._command_history_max - 1 :]
+        history.insert(0, cmd)
 
     def _command_history_prev(self) -> None:
         """Navigate to previous command in history."""
@@ -1349,14 +1599,14 @@ class JsonEditor(
         ):
             num = int(stripped if stripped.isdigit() else stripped[1:])
             if self.jsonl:
-                records = self._jsonl_line_records()
-                for i, rec in enumerate(records):
-                    if rec == num:
-                        self.cursor_row = i
-                        self.cursor_col = 0
-                        self._scroll_cursor_to_top()
-                        return
-                self.status_msg = f"record {num} not found"
+                records = self._current_jsonl_records()
+                try:
+                    self.cursor_row = records.index(num)
+                except ValueError:
+                    self.status_msg = f"record {num} not found"
+                    return
+                self.cursor_col = 0
+                self._scroll_cursor_to_top()
                 return
             self.cursor_row = max(0, min(num - 1, len(self.lines) - 1))
             self.cursor_col = 0
@@ -1429,15 +1679,15 @@ class JsonEditor(
     def _check_content(self, content: str) -> tuple[bool, str]:
         """Validate content as JSON or JSONL. Returns (valid, error_msg)."""
         if self.jsonl:
-            blocks = self._split_jsonl_blocks(content)
-            for i, block in enumerate(blocks, 1):
+            # 첫 오류에서 멈추도록 블록을 하나씩 검사
+            for i, block in enumerate(self._iter_jsonl_blocks(content), 1):
                 try:
-                    json.loads(block)
+                    validate_json(block)
                 except json.JSONDecodeError as e:
                     return False, f"JSONL error: record {i}: {e.msg}"
             return True, ""
         try:
-            json.loads(content)
+            validate_json(content)
             return True, ""
         except json.JSONDecodeError as e:
             return False, f"JSON error: {e.msg} (line {e.lineno})"
@@ -1454,42 +1704,91 @@ class JsonEditor(
         self.post_message(self.JsonValidated(content=content, valid=False, error=err))
         return False
 
+    def _is_formatted(self) -> bool:
+        """마지막 :fmt 이후 버퍼가 바뀌지 않았으면 True."""
+        state = self._formatted_state
+        return (
+            state is not None
+            and state[0] is self.lines
+            and state[1] == self._lines_version
+        )
+
     def _format_json(self) -> None:
+        if self._is_formatted():
+            self.status_msg = "already formatted"
+            return
         if self.jsonl:
             self._format_jsonl()
             return
         content = self.get_content()
         try:
-            parsed = json.loads(content)
-            formatted = json.dumps(parsed, indent=4, ensure_ascii=False)
+            parsed = json_loads(content)
+            formatted = dumps_pretty(parsed)
+        except json.JSONDecodeError as e:
+            self.status_msg = f"cannot format: {e.msg} (line {e.lineno})"
+            return
+        self._apply_formatted(formatted.split("\n"))
+
+    def _apply_formatted(self, new_lines: list[str]) -> None:
+        """Replace the buffer with *new_lines* unless it is already identical."""
+        if new_lines == self.lines:
+            self.status_msg = "already formatted"
+        else:
             self._save_undo()
-            self.lines = formatted.split("\n")
+            self.lines = new_lines
             self.cursor_row = 0
             self.cursor_col = 0
             self._folds.clear()
             self._collapsed_strings.clear()
             self.status_msg = "formatted"
-        except json.JSONDecodeError as e:
-            self.status_msg = f"cannot format: {e.msg} (line {e.lineno})"
+        self._formatted_state = (self.lines, self._lines_version)
 
     def _format_jsonl(self) -> None:
         content = self.get_content()
-        blocks = self._split_jsonl_blocks(content)
-        formatted: list[str] = []
-        for i, block in enumerate(blocks):
+        if len(content) < _THREADED_FORMAT_MIN or not self.is_attached:
+            self._finish_format_jsonl(*self._formatted_jsonl_lines(content))
+            return
+        # 큰 파일은 UI가 멈추지 않도록 워커 스레드에서 파싱하고, 결과는
+        # 그 사이 버퍼가 바뀌지 않았을 때만 UI 스레드에서 적용
+        version = self._lines_version
+        self.status_msg = "formatting..."
+        self.run_worker(
+            lambda: self.app.call_from_thread(
+                self._finish_format_jsonl,
+                *self._formatted_jsonl_lines(content),
+                version,
+            ),
+            group="format",
+            exclusive=True,
+            thread=True,
+        )
+
+    @staticmethod
+    def _formatted_jsonl_lines(content: str) -> tuple[list[str] | None, str]:
+        """Pretty-print every JSONL block; returns (lines, error message)."""
+        # 레코드 사이에 빈 줄을 두고 라인 리스트를 바로 구성 (join→split 생략)
+        new_lines: list[str] = []
+        for i, block in enumerate(JsonEditor._iter_jsonl_blocks(content)):
             try:
-                parsed = json.loads(block)
-                formatted.append(json.dumps(parsed, indent=4, ensure_ascii=False))
+                parsed = json_loads(block)
             except json.JSONDecodeError as e:
-                self.status_msg = f"cannot format: record {i + 1}: {e.msg}"
-                return
-        self._save_undo()
-        self.lines = "\n\n".join(formatted).split("\n")
-        self._folds.clear()
-        self._collapsed_strings.clear()
-        self.cursor_row = 0
-        self.cursor_col = 0
-        self.status_msg = "formatted"
+                return None, f"cannot format: record {i + 1}: {e.msg}"
+            if i:
+                new_lines.append("")
+            new_lines.extend(dumps_pretty(parsed).split("\n"))
+        return new_lines or [""], ""
+
+    def _finish_format_jsonl(
+        self, new_lines: list[str] | None, error: str, version: int | None = None
+    ) -> None:
+        if version is not None and version != self._lines_version:
+            self.status_msg = "buffer changed, format cancelled"
+        elif new_lines is None:
+            self.status_msg = error
+        else:
+            self._apply_formatted(new_lines)
+        if version is not None:
+            self.refresh()
 
     def _find_string_at_cursor(self) -> tuple[int, int, str] | None:
         """Find a string value on the current line.
@@ -1551,7 +1850,7 @@ class JsonEditor(
             return
 
         # Format and send for editing
-        formatted = json.dumps(parsed, indent=4, ensure_ascii=False)
+        formatted = dumps_pretty(parsed)
         self.post_message(
             self.EmbeddedEditRequested(
                 content=formatted,
@@ -1565,72 +1864,166 @@ class JsonEditor(
         self, row: int, col_start: int, col_end: int, new_content: str
     ) -> None:
         """Update a string value with new JSON content."""
-        self._save_undo()
         # Escape the new content as a JSON string
-        escaped = json.dumps(new_content, ensure_ascii=False)
+        escaped = dumps_compact(new_content)
         line = self.lines[row]
-        self.lines[row] = line[:col_start] + escaped + line[col_end:]
+        self._mutate(row, row + 1, [line[:col_start] + escaped + line[col_end:]])
         self.refresh()
 
     # -- JSONL helpers -----------------------------------------------------
 
     @staticmethod
-    def _jsonl_to_pretty(content: str) -> str:
-        """Convert JSONL (one-json-per-line) to pretty-printed blocks."""
-        blocks: list[str] = []
-        for line in content.split("\n"):
-            stripped = line.strip()
-            if not stripped:
+    def _jsonl_to_pretty_lines(content: str) -> Iterator[str]:
+        """Yield editor lines of pretty-printed blocks for JSONL *content*."""
+        first = True
+        # StringIO는 "\n"에서만 나누며 전체 라인 리스트를 만들지 않음
+        for line in io.StringIO(content):
+            if line.isspace():
                 continue
+            if not first:
+                yield ""  # 블록 구분 빈 줄
+            first = False
             try:
-                parsed = json.loads(stripped)
-                blocks.append(json.dumps(parsed, indent=4, ensure_ascii=False))
+                # JSON 파서가 앞뒤 공백/개행을 허용하므로 보통은 strip 복사 없이
+                # 원본 라인을 그대로 파싱
+                parsed = json_loads(line)
             except json.JSONDecodeError:
-                blocks.append(stripped)
-        return "\n\n".join(blocks)
+                stripped = line.strip()
+                try:
+                    parsed = json_loads(stripped)
+                except json.JSONDecodeError:
+                    yield stripped
+                    continue
+            yield from dumps_pretty(parsed).split("\n")
 
     @staticmethod
-    def _split_jsonl_blocks(content: str) -> list[str]:
-        """Split pretty-printed content into blocks separated by blank lines."""
-        blocks: list[str] = []
+    def _jsonl_to_pretty(content: str) -> str:
+        """Convert JSONL (one-json-per-line) to pretty-printed blocks."""
+        return "\n".join(JsonEditor._jsonl_to_pretty_lines(content))
+
+    @staticmethod
+    def _iter_jsonl_blocks(content: str) -> Iterator[str]:
+        """Yield blocks of pretty-printed content separated by blank lines."""
+        # 라인을 지연 순회하므로 피크 메모리는 가장 큰 블록 크기 수준.
+        # StringIO 라인은 끝의 "\n"을 포함 (빈 줄은 "\n" → isspace)
         current: list[str] = []
-        for line in content.split("\n"):
-            if line.strip():
+        for line in io.StringIO(content):
+            if not line.isspace():
                 current.append(line)
-            else:
-                if current:
-                    blocks.append("\n".join(current))
-                    current = []
+            elif current:
+                yield "".join(current).removesuffix("\n")
+                current = []
         if current:
-            blocks.append("\n".join(current))
-        return blocks
+            yield "".join(current).removesuffix("\n")
+
+    @staticmethod
+    def _split_jsonl_blocks(content: str) -> list[str]:
+        """Split pretty-printed content into blocks separated by blank lines."""
+        return list(JsonEditor._iter_jsonl_blocks(content))
 
     @staticmethod
     def _pretty_to_jsonl(content: str) -> str:
         """Convert pretty-printed blocks back to JSONL (one-json-per-line)."""
-        blocks = JsonEditor._split_jsonl_blocks(content)
         lines: list[str] = []
-        for block in blocks:
+        for block in JsonEditor._iter_jsonl_blocks(content):
+            # 이미 한 줄인 레코드는 파싱/직렬화 없이 그대로 저장
+            if "\n" not in block:
+                lines.append(block.strip())
+                continue
             try:
-                parsed = json.loads(block)
-                lines.append(json.dumps(parsed, ensure_ascii=False))
+                parsed = json_loads(block)
+                lines.append(dumps_compact(parsed))
             except json.JSONDecodeError:
                 lines.append(" ".join(block.split()))
         return "\n".join(lines)
 
     # -- Movement helpers --------------------------------------------------
 
+    def _motion_left(self) -> None:
+        self.cursor_col -= 1
+
+    def _motion_right(self) -> None:
+        self.cursor_col += 1
+
+    def _motion_down(self) -> None:
+        self.cursor_row = (
+            self._next_visible_line(self.cursor_row, 1)
+            if self._folds
+            else self.cursor_row + 1
+        )
+
+    def _motion_up(self) -> None:
+        self.cursor_row = (
+            self._next_visible_line(self.cursor_row, -1)
+            if self._folds
+            else self.cursor_row - 1
+        )
+
+    def _motion_line_start(self) -> None:
+        self.cursor_col = 0
+
+    def _motion_line_end(self) -> None:
+        self.cursor_col = max(0, len(self.lines[self.cursor_row]) - 1)
+
+    def _motion_first_nonblank(self) -> None:
+        line = self.lines[self.cursor_row]
+        self.cursor_col = len(line) - len(line.lstrip())
+
+    def _motion_last_line(self) -> None:
+        self.cursor_row = len(self.lines) - 1
+        self._scroll_cursor_to_top()
+
+    def _motion_rows(self, count: int) -> None:
+        """count만큼 (fold를 건너뛰며) 커서를 위/아래로 이동."""
+        if self._folds:
+            self.cursor_row = self._skip_visible_lines(
+                self.cursor_row, abs(count), 1 if count > 0 else -1
+            )
+        else:
+            self.cursor_row += count
+
+    def _motion_page_down(self) -> None:
+        self._motion_rows(self._visible_height())
+
+    def _motion_page_up(self) -> None:
+        self._motion_rows(-self._visible_height())
+
+    def _motion_half_page_down(self) -> None:
+        self._motion_rows(self._visible_height() // 2)
+
+    def _motion_half_page_up(self) -> None:
+        self._motion_rows(-(self._visible_height() // 2))
+
+    def _scroll_line_down(self) -> None:
+        nxt = (
+            self._next_visible_line(self._scroll_top, 1)
+            if self._folds
+            else self._scroll_top + 1
+        )
+        self._scroll_top = min(nxt, len(self.lines) - 1)
+
+    def _scroll_line_up(self) -> None:
+        prev = (
+            self._next_visible_line(self._scroll_top, -1)
+            if self._folds
+            else self._scroll_top - 1
+        )
+        self._scroll_top = max(prev, 0)
+
+    def _show_file_info(self) -> None:
+        total = len(self.lines)
+        pct = (self.cursor_row + 1) * 100 // total if total else 0
+        self.status_msg = (
+            f'"{self._mode.name}" line {self.cursor_row + 1} of {total} --{pct}%--'
+        )
+
     def _current_indent(self) -> int:
         line = self.lines[self.cursor_row]
         return len(line) - len(line.lstrip()) if line.strip() else 0
 
     def _move_word_forward(self) -> None:
         line = self.lines[self.cursor_row]
-        col = self.cursor_col
-        while col < len(line) and (line[col].isalnum() or line[col] == "_"):
-            col += 1
-        while col < len(line) and not (line[col].isalnum() or line[col] == "_"):
-            col += 1
+        col = self._WORD_FWD_RE.match(line, self.cursor_col).end()
         if col >= len(line) and self.cursor_row < len(self.lines) - 1:
             self.cursor_row += 1
             nline = self.lines[self.cursor_row]
@@ -1646,12 +2039,11 @@ class JsonEditor(
                 self.cursor_row -= 1
                 self.cursor_col = max(0, len(self.lines[self.cursor_row]) - 1)
             return
-        col -= 1
-        while col > 0 and not (line[col].isalnum() or line[col] == "_"):
-            col -= 1
-        while col > 0 and (line[col - 1].isalnum() or line[col - 1] == "_"):
-            col -= 1
-        self.cursor_col = col
+        # col-1 이하에서 마지막 단어의 시작 (없으면 0)
+        start = 0
+        for m in self._WORD_RE.finditer(line, 0, col):
+            start = m.start()
+        self.cursor_col = start
 
     def _jump_matching_bracket(self) -> None:
         line = self.lines[self.cursor_row]
@@ -1664,141 +2056,144 @@ class JsonEditor(
             self._search_bracket_backward(ch, self._BRACKET_PAIRS_REV[ch])
 
     def _search_bracket_forward(self, open_ch: str, close_ch: str) -> None:
-        depth = 1
-        row, col = self.cursor_row, self.cursor_col + 1
-        while row < len(self.lines):
-            line = self.lines[row]
-            while col < len(line):
-                if line[col] == open_ch:
-                    depth += 1
-                elif line[col] == close_ch:
-                    depth -= 1
-                    if depth == 0:
-                        self.cursor_row, self.cursor_col = row, col
-                        return
-                col += 1
-            row += 1
-            col = 0
+        pos = self._scan_bracket_forward(
+            self.cursor_row, self.cursor_col + 1, open_ch, close_ch
+        )
+        if pos:
+            self.cursor_row, self.cursor_col = pos
 
     def _search_bracket_backward(self, close_ch: str, open_ch: str) -> None:
-        depth = 1
-        row, col = self.cursor_row, self.cursor_col - 1
-        while row >= 0:
-            line = self.lines[row]
-            while col >= 0:
-                if line[col] == close_ch:
-                    depth += 1
-                elif line[col] == open_ch:
-                    depth -= 1
-                    if depth == 0:
-                        self.cursor_row, self.cursor_col = row, col
-                        return
-                col -= 1
-            row -= 1
-            if row >= 0:
-                col = len(self.lines[row]) - 1
+        pos = self._scan_bracket_backward(
+            self.cursor_row, self.cursor_col - 1, close_ch, open_ch
+        )
+        if pos:
+            self.cursor_row, self.cursor_col = pos
+
+    # NORMAL 모드 단순 모션: event.character / event.key → 메서드
+    _NORMAL_CHAR_MOTIONS = {
+        "h": _motion_left,
+        "j": _motion_down,
+        "k": _motion_up,
+        "l": _motion_right,
+        "w": _move_word_forward,
+        "b": _move_word_backward,
+        "0": _motion_line_start,
+        "$": _motion_line_end,
+        "^": _motion_first_nonblank,
+        "G": _motion_last_line,
+        "%": _jump_matching_bracket,
+    }
+    _NORMAL_KEY_MOTIONS = {
+        "left": _motion_left,
+        "down": _motion_down,
+        "up": _motion_up,
+        "right": _motion_right,
+        "end": _motion_line_end,
+        "home": _motion_first_nonblank,
+        "pagedown": _motion_page_down,
+        "ctrl+f": _motion_page_down,
+        "pageup": _motion_page_up,
+        "ctrl+b": _motion_page_up,
+        "ctrl+d": _motion_half_page_down,
+        "ctrl+u": _motion_half_page_up,
+        "ctrl+e": _scroll_line_down,
+        "ctrl+y": _scroll_line_up,
+        "ctrl+g": _show_file_info,
+    }
 
     # -- Edit helpers ------------------------------------------------------
 
     def _delete_word(self) -> None:
         line = self.lines[self.cursor_row]
-        col = self.cursor_col
-        start = col
-        while col < len(line) and (line[col].isalnum() or line[col] == "_"):
-            col += 1
-        while col < len(line) and line[col] == " ":
-            col += 1
+        start = self.cursor_col
+        col = self._WORD_DEL_RE.match(line, start).end()
         if col == start and col < len(line):
             col += 1
-        self.lines[self.cursor_row] = line[:start] + line[col:]
+        self._mutate(self.cursor_row, self.cursor_row + 1, [line[:start] + line[col:]])
 
     def _paste_after(self) -> None:
         if not self.yank_buffer:
             return
-        self._save_undo()
         if self._yank_type == "char":
-            text = self.yank_buffer[0]
             line = self.lines[self.cursor_row]
-            insert_col = min(self.cursor_col + 1, len(line))
-            if "\n" not in text:
-                self.lines[self.cursor_row] = (
-                    line[:insert_col] + text + line[insert_col:]
-                )
-                self.cursor_col = insert_col + len(text) - 1
-            else:
-                parts = text.split("\n")
-                after = line[insert_col:]
-                self.lines[self.cursor_row] = line[:insert_col] + parts[0]
-                for i, p in enumerate(parts[1:], 1):
-                    if i == len(parts) - 1:
-                        self.lines.insert(self.cursor_row + i, p + after)
-                    else:
-                        self.lines.insert(self.cursor_row + i, p)
-                inserted = len(parts) - 1
-                self._adjust_line_indices(self.cursor_row + 1, inserted)
-                self.cursor_row += inserted
-                self.cursor_col = len(parts[-1]) - 1
+            self._paste_chars(min(self.cursor_col + 1, len(line)))
             return
-        inserted = len(self.yank_buffer)
-        for i, line in enumerate(self.yank_buffer):
-            self.lines.insert(self.cursor_row + 1 + i, line)
-        self._adjust_line_indices(self.cursor_row + 1, inserted)
-        self.cursor_row += 1
+        # 여러 줄을 슬라이스 대입 한 번으로 삽입 (뒤쪽 라인 이동 1회)
+        row = self.cursor_row + 1
+        self._mutate(row, row, self.yank_buffer)
+        self._adjust_line_indices(row, len(self.yank_buffer))
+        self.cursor_row = row
         self.cursor_col = 0
 
     def _paste_before(self) -> None:
         if not self.yank_buffer:
             return
-        self._save_undo()
         if self._yank_type == "char":
-            text = self.yank_buffer[0]
-            line = self.lines[self.cursor_row]
-            insert_col = self.cursor_col
-            if "\n" not in text:
-                self.lines[self.cursor_row] = (
-                    line[:insert_col] + text + line[insert_col:]
-                )
-                self.cursor_col = insert_col + len(text) - 1
-            else:
-                parts = text.split("\n")
-                after = line[insert_col:]
-                self.lines[self.cursor_row] = line[:insert_col] + parts[0]
-                for i, p in enumerate(parts[1:], 1):
-                    if i == len(parts) - 1:
-                        self.lines.insert(self.cursor_row + i, p + after)
-                    else:
-                        self.lines.insert(self.cursor_row + i, p)
-                inserted = len(parts) - 1
-                self._adjust_line_indices(self.cursor_row + 1, inserted)
-                self.cursor_row += inserted
-                self.cursor_col = len(parts[-1]) - 1
+            self._paste_chars(self.cursor_col)
             return
-        inserted = len(self.yank_buffer)
-        for i, line in enumerate(self.yank_buffer):
-            self.lines.insert(self.cursor_row + i, line)
-        self._adjust_line_indices(self.cursor_row, inserted)
+        row = self.cursor_row
+        self._mutate(row, row, self.yank_buffer)
+        self._adjust_line_indices(row, len(self.yank_buffer))
         self.cursor_col = 0
 
+    def _paste_chars(self, insert_col: int) -> None:
+        """Insert the char-wise yank at *insert_col* of the cursor line."""
+        row = self.cursor_row
+        line = self.lines[row]
+        text = self.yank_buffer[0]
+        parts = text.split("\n")
+        last_len = len(parts[-1])
+        parts[0] = line[:insert_col] + parts[0]
+        parts[-1] += line[insert_col:]
+        self._mutate(row, row + 1, parts)
+        if len(parts) == 1:
+            self.cursor_col = insert_col + len(text) - 1
+            return
+        inserted = len(parts) - 1
+        self._adjust_line_indices(row + 1, inserted)
+        self.cursor_row += inserted
+        self.cursor_col = last_len - 1
+
     def _join_lines(self) -> None:
         if self.cursor_row >= len(self.lines) - 1:
             return
-        self._save_undo()
-        cur = self.lines[self.cursor_row].rstrip()
-        nxt = self.lines[self.cursor_row + 1].lstrip()
+        row = self.cursor_row
+        # strip은 지울 공백이 없으면 원본을 그대로 돌려주므로 추가 복사 없음;
+        # f-string으로 합쳐 중간 문자열 (cur + " ") 생성도 피함
+        cur = self.lines[row].rstrip()
+        nxt = self.lines[row + 1].lstrip()
+        self._mutate(row, row + 2, [f"{cur} {nxt}"])
+        self._adjust_line_indices(row + 1, -1)
         self.cursor_col = len(cur)
-        self.lines[self.cursor_row] = cur + " " + nxt
-        deleted_at = self.cursor_row + 1
-        self.lines.pop(deleted_at)
-        self._adjust_line_indices(deleted_at, -1)
+
+    def _restore_undo_entry(
+        self,
+        entry: tuple[int, int, list[str], int, int],
+        inverse_stack: deque[tuple[int, int, list[str], int, int]],
+    ) -> tuple[int, int]:
+        """Put *entry*'s lines back, pushing the replaced range onto *inverse_stack*.
+
+        Returns the cursor position stored in *entry*.
+        """
+        start, tail, old_lines, row, col = entry
+        lines = self.lines
+        end = len(lines) - tail
+        if start == 0 and tail == 0:
+            # 전체 스냅샷: 현재 리스트를 그대로 넘기고 교체
+            inverse_stack.append((0, 0, lines, self.cursor_row, self.cursor_col))
+            self.lines = old_lines
+        else:
+            inverse_stack.append(
+                (start, tail, lines[start:end], self.cursor_row, self.cursor_col)
+            )
+            lines[start:end] = old_lines
+        return row, col
 
     def _undo(self) -> None:
         if not self.undo_stack:
             self.status_msg = "nothing to undo"
             return
-        # Save current state for redo
-        self.redo_stack.append((self.lines[:], self.cursor_row, self.cursor_col))
-        lines, row, col = self.undo_stack.pop()
-        self.lines = lines
+        row, col = self._restore_undo_entry(self.undo_stack.pop(), self.redo_stack)
         self.cursor_row = row
         self.cursor_col = col
         self._visual_mode = ""
@@ -1811,10 +2206,7 @@ class JsonEditor(
         if not self.redo_stack:
             self.status_msg = "nothing to redo"
             return
-        # Save current state for undo
-        self.undo_stack.append((self.lines[:], self.cursor_row, self.cursor_col))
-        lines, row, col = self.redo_stack.pop()
-        self.lines = lines
+        row, col = self._restore_undo_entry(self.redo_stack.pop(), self.undo_stack)
         self.cursor_row = row
         self.cursor_col = col
         self._visual_mode = ""
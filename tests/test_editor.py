@@ -1,7 +1,12 @@
 """Tests for JsonEditor widget."""
 
 from src.jvim.widget import JsonEditor, EditorMode
-from src.jvim._jsonpath import parse_jsonpath_filter, jsonpath_value_matches
+from src.jvim._jsonpath import (
+    jsonpath_find,
+    jsonpath_value_matches,
+    parse_jsonpath_filter,
+)
+from src.jvim._tokenize import STYLE_NAMES, compute_style_ids, style_id_runs
 
 
 class TestEditorBasic:
@@ -28,6 +33,78 @@ class TestEditorBasic:
         editor = JsonEditor(content)
         assert editor.get_content() == content
 
+    def test_get_content_cached_until_edit(self):
+        editor = JsonEditor('{\n    "a": 1\n}')
+        first = editor.get_content()
+        assert editor.get_content() is first
+        editor._save_undo(1, 2)
+        editor.lines[1] = '    "a": 2'
+        assert editor.get_content() == '{\n    "a": 2\n}'
+        editor.lines = ["[]"]
+        assert editor.get_content() == "[]"
+
+    def test_line_starts_and_offsets(self):
+        editor = JsonEditor('{\n    "a": 1\n}')
+        assert list(editor._line_starts()) == [0, 2, 13, 15]
+        assert editor._offset_to_pos(0) == (0, 0)
+        assert editor._offset_to_pos(1) == (0, 1)  # 첫 줄 끝 개행
+        assert editor._offset_to_pos(6) == (1, 4)
+        assert editor._offset_to_pos(13) == (2, 0)
+        starts = editor._line_starts()
+        assert editor._line_starts() is starts
+        editor._mutate(1, 2, ['    "a": 12'])
+        assert list(editor._line_starts()) == [0, 2, 14, 16]
+
+    def test_line_split_only_on_newline(self):
+        """U+2028 등은 줄 구분자가 아니다 (splitlines 사용 금지)."""
+        content = '{"s": "a\u2028b\u0085c"}'
+        editor = JsonEditor()
+        editor.set_content(content)
+        assert editor.lines == [content]
+        editor._format_json()
+        assert editor.lines[1] == '    "s": "a\u2028b\u0085c"'
+
+    def test_format_twice_is_noop(self):
+        editor = JsonEditor('{"a": [1, 2]}')
+        editor._format_json()
+        assert editor.status_msg == "formatted"
+        assert len(editor.undo_stack) == 1
+        editor.cursor_row = 2
+        editor._format_json()
+        assert editor.status_msg == "already formatted"
+        assert len(editor.undo_stack) == 1
+        assert editor.cursor_row == 2
+
+    def test_format_already_formatted_content_keeps_history(self):
+        editor = JsonEditor('{\n    "a": 1\n}')
+        editor._format_json()
+        assert editor.status_msg == "already formatted"
+        assert len(editor.undo_stack) == 0
+        editor._save_undo(1, 2)
+        editor.lines[1] = '    "a":2'
+        editor._format_json()
+        assert editor.status_msg == "formatted"
+        assert editor.lines[1] == '    "a": 2'
+
+    def test_format_jsonl_builds_lines_per_record(self):
+        editor = JsonEditor('{"a":1}\n\n[1]', jsonl=True)
+        editor.lines = ['{"a":1}', "", "", "[1]"]
+        editor._format_json()
+        assert editor.lines == ["{", '    "a": 1', "}", "", "[", "    1", "]"]
+        editor._format_json()
+        assert editor.status_msg == "already formatted"
+
+    def test_stale_threaded_format_result_is_dropped(self):
+        editor = JsonEditor('{"a":1}', jsonl=True)
+        editor.lines = ['{"a":1}']
+        version = editor._lines_version
+        new_lines, error = editor._formatted_jsonl_lines(editor.get_content())
+        editor._mutate(0, 1, ['{"a":2}'])
+        editor.refresh = lambda *a, **k: None
+        editor._finish_format_jsonl(new_lines, error, version)
+        assert editor.lines == ['{"a":2}']
+        assert editor.status_msg == "buffer changed, format cancelled"
+
     def test_set_content(self):
         editor = JsonEditor('{"old": "data"}')
         editor.set_content('{"new": "data"}')
@@ -84,6 +161,53 @@ class TestCacheInvalidation:
         assert editor._cache_dirty is True
         assert editor.lines == ['{"modified": "data"}']
 
+    def test_invalidate_bumps_lines_version(self):
+        editor = JsonEditor('{"key": "value"}')
+        version = editor._lines_version
+        editor._save_undo()
+        assert editor._lines_version == version + 1
+
+    def test_render_signature_tracks_state(self):
+        editor = JsonEditor('{\n    "key": "value"\n}')
+        sig = editor._render_signature(80, 24)
+        assert editor._render_signature(80, 24) == sig
+        editor.cursor_row = 1
+        assert editor._render_signature(80, 24) != sig
+        editor.cursor_row = 0
+        editor._folds[0] = 2
+        assert editor._render_signature(80, 24) != sig
+        editor._folds.clear()
+        editor._invalidate_caches()
+        assert editor._render_signature(80, 24) != sig
+
+    def test_refresh_deferred_until_resize(self):
+        """렌더 불가능한 크기에서는 refresh를 미루고 resize 시 수행."""
+        from types import SimpleNamespace
+
+        editor = JsonEditor('{"key": "value"}')  # 마운트 전: 크기 0
+        editor._refresh_if_visible()
+        assert editor._pending_refresh is True
+        editor.on_resize(SimpleNamespace())
+        assert editor._pending_refresh is False
+
+    def test_noop_key_skips_refresh(self):
+        """렌더 결과가 바뀌지 않으면 refresh하지 않음."""
+        from unittest.mock import patch
+
+        from textual.geometry import Region
+
+        editor = JsonEditor('{"key": "value"}')
+        with (
+            patch.object(JsonEditor, "content_region", Region(0, 0, 40, 10)),
+            patch.object(JsonEditor, "refresh") as refresh,
+        ):
+            editor.render()
+            editor._refresh_if_visible()
+            assert refresh.call_count == 0
+            editor.cursor_col = 1
+            editor._refresh_if_visible()
+            assert refresh.call_count == 1
+
     def test_render_auto_invalidation_skips_empty_cache(self):
         """render() auto-invalidation should skip hash computation when cache is empty."""
         editor = JsonEditor('{"key": "value"}')
@@ -158,6 +282,82 @@ class TestUndoRedo:
 
         assert len(editor.redo_stack) == 0
 
+    def test_range_undo_redo_line_split(self):
+        """구간 undo: enter로 라인 분할 후 undo/redo."""
+        from types import SimpleNamespace
+
+        editor = JsonEditor('{\n    "a": 1,\n    "b": 2\n}')
+        original = editor.lines[:]
+        editor.cursor_row = 1
+        editor.cursor_col = 9
+        editor._save_undo(1, 2)
+        editor._handle_insert(SimpleNamespace(key="enter", character="\r"))
+        split = editor.lines[:]
+        assert len(split) == 5
+
+        editor._undo()
+        assert editor.lines == original
+        assert (editor.cursor_row, editor.cursor_col) == (1, 9)
+
+        editor._redo()
+        assert editor.lines == split
+
+    def test_range_undo_stores_only_range(self):
+        """구간 undo 엔트리는 수정 범위의 라인만 보관."""
+        editor = JsonEditor("\n".join(f'"line{i}"' for i in range(100)))
+        editor._save_undo(50, 51)
+        start, tail, old_lines, _, _ = editor.undo_stack[-1]
+        assert (start, tail, old_lines) == (50, 49, ['"line50"'])
+
+    def test_mutate_records_reverse_patch(self):
+        editor = JsonEditor("a\nb\nc")
+        editor._mutate(1, 2, ["x", "y"])
+        assert editor.lines == ["a", "x", "y", "c"]
+        assert editor.undo_stack[-1][:3] == (1, 1, ["b"])
+        editor._undo()
+        assert editor.lines == ["a", "b", "c"]
+
+    def test_edit_ops_record_ranges(self):
+        """라인 편집 연산은 전체 스냅샷 대신 수정 범위만 기록."""
+        from types import SimpleNamespace
+
+        editor = JsonEditor("\n".join(f"line{i}" for i in range(50)))
+        editor.cursor_row = 10
+        for ch in "ddJ":
+            editor._handle_normal(SimpleNamespace(key=ch, character=ch))
+        editor._handle_normal(SimpleNamespace(key="o", character="o"))
+        assert [len(entry[2]) for entry in editor.undo_stack] == [1, 2, 0]
+        for _ in range(3):
+            editor._undo()
+        assert editor.lines == [f"line{i}" for i in range(50)]
+
+    def test_closing_bracket_mid_line_single_undo(self):
+        from types import SimpleNamespace
+
+        editor = JsonEditor('"a"')
+        editor.cursor_col = 3
+        editor._mode = EditorMode.INSERT
+        editor._handle_insert(SimpleNamespace(key="right_curly_bracket", character="}"))
+        assert editor.lines == ['"a"}']
+        assert len(editor.undo_stack) == 1
+
+    def test_undo_stack_capped(self):
+        editor = JsonEditor('{"a": 1}')
+        for i in range(250):
+            editor.cursor_col = i
+            editor._save_undo(0, 1)
+        assert len(editor.undo_stack) == 200
+        assert editor.undo_stack[0][4] == 50  # oldest entries evicted
+
+    def test_set_content_clears_history(self):
+        editor = JsonEditor('{"a": 1}')
+        editor._save_undo(0, 1)
+        editor.lines[0] = '{"a": 2}'
+        editor.set_content('{"b": 1}')
+        assert len(editor.undo_stack) == 0
+        editor._undo()
+        assert editor.lines == ['{"b": 1}']
+
 
 class TestEmbeddedJson:
     """Tests for embedded JSON editing (ej command)."""
@@ -216,12 +416,30 @@ class TestJsonl:
         assert len(lines) == 2
         assert '{"a": 1}' in lines[0] or '{"a":1}' in lines[0]
 
+    def test_pretty_to_jsonl_keeps_single_line_records(self):
+        pretty = '  {"a":1, "b": [ ]}\n\n{\n    "c": 2\n}\n\nnot  json'
+        result = JsonEditor._pretty_to_jsonl(pretty)
+        assert result.split("\n") == ['{"a":1, "b": [ ]}', '{"c": 2}', "not  json"]
+
+    def test_jsonl_to_pretty_lines_matches_string_form(self):
+        content = '{"a": [1, 2]}\n\nnot json\n{"b": {}}\n'
+        lines = list(JsonEditor._jsonl_to_pretty_lines(content))
+        assert lines == JsonEditor._jsonl_to_pretty(content).split("\n")
+        assert JsonEditor(content, jsonl=True).lines == lines
+        assert JsonEditor("\n  \n", jsonl=True).lines == [""]
+
     def test_split_jsonl_blocks(self):
         content = '{\n    "a": 1\n}\n\n{\n    "b": 2\n}'
         blocks = JsonEditor._split_jsonl_blocks(content)
 
         assert len(blocks) == 2
 
+    def test_iter_jsonl_blocks_is_lazy(self):
+        content = '{"a": 1}\n\n\n  \n{\n    "b": 2\n}\n'
+        blocks = JsonEditor._iter_jsonl_blocks(content)
+        assert next(blocks) == '{"a": 1}'
+        assert list(blocks) == ['{\n    "b": 2\n}']
+
     def test_jsonl_mode_init(self):
         content = '{"a": 1}\n{"b": 2}'
         editor = JsonEditor(content, jsonl=True)
@@ -237,6 +455,39 @@ class TestJsonl:
         assert 1 in records
         assert 2 in records
 
+    def test_jsonl_gutter_width_from_record_count(self):
+        content = "\n".join(f'{{"a": {i}}}' for i in range(120))
+        editor = JsonEditor(content, jsonl=True)
+        _, rec_w, _ = editor._gutter_widths()
+        assert rec_w == 3
+
+        editor.lines = editor.lines[:3]
+        editor._invalidate_caches()
+        _, rec_w, _ = editor._gutter_widths()
+        assert rec_w == 2
+
+    def test_records_cache_survives_same_shape_edit(self):
+        editor = JsonEditor('{"a": 1}\n{"b": 2}', jsonl=True)
+        records = editor._current_jsonl_records()
+        assert editor._jsonl_records_cache is records
+
+        # 빈 줄 구성이 그대로면 레코드 맵 재사용
+        editor._mutate(1, 2, ['    "a": 12'])
+        assert editor._jsonl_records_cache is records
+
+        # 빈 줄이 생기면 수정 구간부터 갱신
+        editor._mutate(1, 2, [""])
+        assert editor._jsonl_records_cache == editor._jsonl_line_records()
+
+    def test_records_cache_patched_on_block_split_and_merge(self):
+        editor = JsonEditor('{"a": 1}\n{"b": 2}\n{"c": 3}', jsonl=True)
+        editor._current_jsonl_records()
+        editor._mutate(1, 1, ["", "[]"])
+        assert editor._jsonl_records_cache == editor._jsonl_line_records()
+        assert max(editor._jsonl_records_cache) == 4
+        editor._mutate(3, 5, [])
+        assert editor._jsonl_records_cache == editor._jsonl_line_records()
+
 
 class TestEditorMode:
     """Tests for editor mode handling."""
@@ -292,6 +543,41 @@ class TestJsonValidation:
         assert valid is False
         assert "JSONL error" in err
 
+    def test_validation_matches_stdlib_json(self):
+        """fast backend 유무와 관계없이 json.loads와 같은 판정."""
+        # NaN, 64비트 초과 정수는 json.loads만 허용 → fallback 경로
+        for text in ('{"n": NaN}', '{"big": 123456789012345678901234567890}'):
+            editor = JsonEditor(text)
+            assert editor._check_content(editor.get_content()) == (True, "")
+
+    def test_format_keeps_big_ints_and_nan(self):
+        """포맷/변환 경로도 json.loads와 같은 값 (큰 정수가 float로 바뀌지 않음)."""
+        content = '{"big": 123456789012345678901234567890, "n": NaN, "f": 1.5}'
+        editor = JsonEditor(content, jsonl=True)
+        assert JsonEditor._pretty_to_jsonl(editor.get_content()) == content
+
+    def test_format_output_matches_json_dumps(self):
+        import json
+
+        data = {"k": ["한글", 1.0, None, {"n": [True]}], "e": {}}
+        editor = JsonEditor(json.dumps(data))
+        editor._format_json()
+        expected = json.dumps(data, indent=4, ensure_ascii=False)
+        assert editor.get_content() == expected
+
+    def test_invalid_json_error_message(self):
+        import json
+
+        text = '{\n    "a": 1,\n}'
+        editor = JsonEditor(text)
+        valid, err = editor._check_content(editor.get_content())
+        try:
+            json.loads(text)
+        except json.JSONDecodeError as e:
+            expected = f"JSON error: {e.msg} (line {e.lineno})"
+        assert valid is False
+        assert err == expected
+
 
 class TestMovement:
     """Tests for cursor movement."""
@@ -335,6 +621,63 @@ class TestMovement:
 
         assert editor.cursor_col < 10
 
+    def test_normal_motion_dispatch(self):
+        from types import SimpleNamespace
+
+        editor = JsonEditor('{\n    "a": 1\n}')
+        editor._handle_normal(SimpleNamespace(key="j", character="j"))
+        editor._handle_normal(SimpleNamespace(key="end", character=None))
+        assert (editor.cursor_row, editor.cursor_col) == (1, 9)
+        editor._handle_normal(SimpleNamespace(key="circumflex_accent", character="^"))
+        assert editor.cursor_col == 4
+        editor._handle_normal(SimpleNamespace(key="ctrl+g", character="\x07"))
+        assert editor.status_msg == '"NORMAL" line 2 of 3 --66%--'
+
+    def test_word_motions_exact_positions(self):
+        editor = JsonEditor('{"my_key": "값1", "x": 2}')
+        editor.cursor_col = 2  # m
+        editor._move_word_forward()
+        assert editor.cursor_col == 12  # 값
+        editor._move_word_backward()
+        assert editor.cursor_col == 2
+        editor.cursor_col = 16  # ,
+        editor._move_word_backward()
+        assert editor.cursor_col == 12
+
+    def test_delete_word_trailing_spaces(self):
+        editor = JsonEditor("abc_1   def")
+        editor._delete_word()
+        assert editor.lines[0] == "def"
+        editor.lines[0] = ", x"
+        editor._delete_word()
+        assert editor.lines[0] == " x"
+
+
+class TestScrolling:
+    """Tests for keeping the cursor inside the viewport."""
+
+    def test_ensure_cursor_visible_far_jump(self):
+        editor = JsonEditor("\n".join(f'"{i}"' for i in range(100000)))
+        editor._visible_height = lambda: 30
+        editor.cursor_row = 99999
+        editor._ensure_cursor_visible(80)
+        assert editor._scroll_top == 99999 - 30 + 1
+
+    def test_ensure_cursor_visible_wrapped_lines(self):
+        editor = JsonEditor("\n".join(["x" * 200] * 50))
+        editor._visible_height = lambda: 10
+        editor.cursor_row = 40
+        editor._ensure_cursor_visible(80)  # 라인당 3행
+        assert editor._scroll_top == 37  # 커서 위 3줄(9행) + 커서 행
+
+    def test_cursor_wrap_dy_ascii_and_wide(self):
+        editor = JsonEditor()
+        assert editor._cursor_wrap_dy("x" * 25, 24, 10) == 2
+        assert editor._cursor_wrap_dy("x" * 20, 20, 10) == 2  # 끝 커서는 다음 행
+        assert editor._cursor_wrap_dy("x" * 19, 19, 10) == 1
+        assert editor._cursor_wrap_dy("", 0, 10) == 0
+        assert editor._cursor_wrap_dy("한" * 10, 5, 10) == 1
+
 
 class TestBracketMatching:
     """Tests for bracket matching (% command)."""
@@ -353,6 +696,24 @@ class TestBracketMatching:
 
         assert editor.cursor_col == 0  # On {
 
+    def test_jump_matching_bracket_nested_multiline(self):
+        content = '{\n    "a": {"b": {}}, "c": [{\n        "d": 1\n    }]\n}'
+        editor = JsonEditor(content)
+        editor._jump_matching_bracket()
+        assert (editor.cursor_row, editor.cursor_col) == (4, 0)
+        editor._jump_matching_bracket()
+        assert (editor.cursor_row, editor.cursor_col) == (0, 0)
+
+        editor.cursor_row, editor.cursor_col = 1, 9  # outer { of "a"
+        editor._jump_matching_bracket()
+        assert (editor.cursor_row, editor.cursor_col) == (1, 17)
+
+    def test_jump_matching_bracket_unmatched_stays(self):
+        editor = JsonEditor('{"a": [1, 2')
+        editor.cursor_col = 6
+        editor._jump_matching_bracket()
+        assert editor.cursor_col == 6
+
 
 class TestCharWidth:
     """Tests for character width calculation (CJK support)."""
@@ -381,6 +742,115 @@ class TestCharWidth:
         assert w1 == w2 == 2
         assert "한" in editor._char_width_cache
 
+    def test_wide_segments_cached(self):
+        editor = JsonEditor()
+        line = '"키": "' + "한글" * 10 + '"'
+        segs = editor._make_segments(line, 10)
+        assert editor._make_segments(line, 10) is segs
+        assert editor._wrap_rows(line, 10) == len(segs)
+        assert all(sum(editor._char_width(c) for c in line[s:e]) <= 10 for s, e in segs)
+
+    def test_wide_segments_boundaries(self):
+        assert JsonEditor._wide_segments("ab한cd", 3) == [(0, 2), (2, 4), (4, 5)]
+        # 폭이 avail보다 큰 문자도 한 세그먼트에 최소 1문자
+        assert JsonEditor._wide_segments("한한", 1) == [(0, 1), (1, 2)]
+
+    def test_tail_width(self):
+        editor = JsonEditor()
+        for line in ("ab한cd", "한한한", "abcdefg", "abcdef", ""):
+            segs = editor._make_segments(line, 3) if line else [(0, 0)]
+            ls, le = segs[-1]
+            expected = sum(editor._char_width(c) for c in line[ls:le])
+            assert editor._tail_width(line, 3) == expected
+
+    def test_char_width_cache_shared(self):
+        JsonEditor()._char_width("漢")
+        assert "漢" in JsonEditor()._char_width_cache
+
+
+class TestSyntaxStyles:
+    """Tests for per-line syntax highlight styles."""
+
+    def test_key_value_styles(self):
+        line = '"k": "v:1", "n": 12, "t": true'
+        styles = JsonEditor._compute_line_styles(line)
+        assert len(styles) == len(line)
+        assert styles[0:3] == ["cyan"] * 3  # "k"
+        assert styles[5:10] == ["green"] * 5  # "v:1" (colon inside string)
+        assert styles[line.index("12")] == "yellow"
+        assert styles[line.index("true") :] == ["magenta"] * 4
+
+    def test_keyword_inside_string_not_highlighted(self):
+        line = '"a": "null", "b": [null]'
+        styles = JsonEditor._compute_line_styles(line)
+        assert styles[line.index("null")] == "green"
+        assert styles[line.rindex("null")] == "magenta"
+        assert styles[line.index("[")] == "bold white"
+
+    def test_escaped_quote_stays_in_string(self):
+        line = '"a\\"b": 1'
+        styles = JsonEditor._compute_line_styles(line)
+        assert styles[: line.index(":")] == ["cyan"] * line.index(":")
+        assert styles[-1] == "yellow"
+
+    def test_style_ids_match_style_names(self):
+        line = '{"a": [1, true], "b": "x"}'
+        ids = compute_style_ids(line)
+        assert isinstance(ids, bytearray) and len(ids) == len(line)
+        assert [STYLE_NAMES[i] for i in ids] == JsonEditor._compute_line_styles(line)
+
+    def test_unterminated_string_runs_to_end_of_line(self):
+        line = '"a": "b[1'
+        styles = JsonEditor._compute_line_styles(line)
+        assert styles[5:] == ["green", "green", "bold white", "green"]
+
+    def test_style_id_runs_with_overlay_names(self):
+        ids = bytearray([2, 2, 6, 6, 0])
+        names = (*STYLE_NAMES, "on dark_blue")
+        assert style_id_runs(ids, names) == [
+            (0, 2, "cyan"),
+            (2, 4, "on dark_blue"),
+            (4, 5, "white"),
+        ]
+
+    def test_non_ascii_chars_use_default_class(self):
+        line = '"한[": ١٢, "v": 3'
+        styles = JsonEditor._compute_line_styles(line)
+        assert styles[:5] == ["cyan", "cyan", "bold white", "cyan", "white"]
+        assert styles[line.index("١")] == "white"
+        assert styles[-1] == "yellow"
+
+
+class TestRenderAssembly:
+    """Tests for building the rendered Text from (text, style) pieces."""
+
+    def test_assemble_text_spans(self):
+        pieces = [("12 ", "dim cyan"), ('"k"', "cyan"), (": ", "white"), ("\n", "")]
+        text = JsonEditor._assemble_text(pieces)
+        assert text.plain == '12 "k": \n'
+        assert [(s.start, s.end, s.style) for s in text.spans] == [
+            (0, 3, "dim cyan"),
+            (3, 6, "cyan"),
+            (6, 8, "white"),
+        ]
+
+    def test_assemble_text_merges_adjacent_same_style(self):
+        pieces = [("~\n", "dim blue"), ("~\n", "dim blue"), ("", "cyan"), ("x", "")]
+        text = JsonEditor._assemble_text(pieces)
+        assert [(s.start, s.end, s.style) for s in text.spans] == [
+            (0, 4, "dim blue"),
+            (4, 4, "cyan"),
+        ]
+
+    def test_assemble_text_control_chars(self):
+        from rich.text import Text
+
+        pieces = [("a\r", "cyan"), ("b", "green"), ("\n", "")]
+        text = JsonEditor._assemble_text(pieces)
+        expected = Text.assemble(*pieces)
+        assert text.plain == expected.plain == "ab\n"
+        assert text.spans == expected.spans
+
 
 class TestJsonPathFilter:
     """Tests for JSONPath search with value filtering."""
@@ -483,6 +953,118 @@ class TestJsonPathFilter:
         assert not jsonpath_value_matches("Mary", "~", "^J")
         assert jsonpath_value_matches("test@email.com", "~", r"@.*\.com$")
 
+    def test_recursive_descent_document_order(self):
+        data = {"a": {"a": 1, "b": [{"a": 2}]}, "c": {"a": 3}}
+        assert jsonpath_find(data, "$..a") == [
+            ["a"],
+            ["a", "a"],
+            ["a", "b", 0, "a"],
+            ["c", "a"],
+        ]
+        assert jsonpath_find(data, "$..b[0].a") == [["a", "b", 0, "a"]]
+
+    def test_recursive_descent_deep_nesting(self):
+        data = leaf = {}
+        for _ in range(3000):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+        leaf["k"] = 1
+        (path,) = jsonpath_find(data, "$..k")
+        assert len(path) == 3001
+
+    def test_literal_search_matches_regex_results(self):
+        editor = JsonEditor('"aXa": "XaXa"\n"Xa.X"')
+        editor._search_buffer = "Xa"
+        editor._execute_search()
+        assert editor._search_matches == [(0, 2, 4), (0, 8, 10), (0, 10, 12), (1, 1, 3)]
+        editor._search_buffer = "Xa.X"
+        editor._execute_search()
+        assert editor._search_matches == [(1, 1, 5)]
+
+    def test_key_index_skips_string_values(self):
+        editor = JsonEditor('{\n  "a": "b: c", "d\\"e" :1,\n  "x\\\\": ["y"]\n}')
+        index = editor._build_key_index()
+        assert index == {'"a"': [(1, 2)], '"d\\"e"': [(1, 15)], '"x\\\\"': [(2, 2)]}
+
+    def test_jsonl_blocks_parsed_once_per_version(self):
+        editor = JsonEditor('{"a": 1}\nnull\n{bad', jsonl=True)
+        parsed = editor._parsed_jsonl_blocks()
+        # 파싱 실패 블록은 null과 구분되는 표시 객체
+        assert parsed[:2] == [{"a": 1}, None]
+        assert len(parsed) == 3 and parsed[2] is not None
+        assert editor._parsed_jsonl_blocks() is parsed
+
+        editor._search_buffer = "$.a"
+        editor._execute_search()
+        assert editor._search_matches == [(1, 9, 10)]
+        assert editor._parsed_jsonl_blocks() is parsed
+
+    def test_find_value_end(self):
+        end = JsonEditor._find_value_end
+        line = '"k": "a\\"b", -1.5e+3, true, null, x'
+        assert end(line, 5) == 11
+        assert end(line, 13) == 20
+        assert end(line, 22) == 26
+        assert end(line, 28) == 32
+        assert end(line, 34) == 34
+        assert end('"open', 0) == 5
+
+    def test_array_scalar_position(self):
+        editor = JsonEditor('{\n    "a": [7, 8],\n    "b": [\n        9\n    ]\n}')
+        editor._search_buffer = "$.b[0]"
+        editor._execute_search()
+        assert editor._search_matches == [(3, 8, 9)]
+        editor._search_buffer = "$.a[*]"
+        editor._execute_search()
+        assert editor._search_matches == [(1, 10, 11), (1, 13, 14)]
+
+    def test_key_index_cached_per_version(self):
+        editor = JsonEditor('{"a": 1}\n\n{"a": 2}', jsonl=True)
+        index = editor._build_key_index()
+        starts = editor._compute_block_start_lines()
+        assert editor._build_key_index() is index
+        assert editor._compute_block_start_lines() is starts
+
+        editor._mutate(0, 1, ["{", '    "b": 1', "}"])
+        assert editor._build_key_index() is not index
+        assert '"b"' in editor._build_key_index()
+
+    def test_match_near_cursor_sorted_and_unsorted(self):
+        editor = JsonEditor("\n".join(["abc"] * 5))
+        editor.cursor_row, editor.cursor_col = 2, 1
+        for matches, forward, backward in (
+            ([(0, 0, 1), (2, 1, 2), (4, 0, 1)], 1, 1),
+            ([(4, 0, 1), (0, 0, 1), (2, 2, 3)], 0, 1),
+        ):
+            editor._search_matches = matches
+            editor._build_search_row_index()
+            editor._search_forward = True
+            assert editor._find_match_near_cursor() == forward
+            editor._search_forward = False
+            assert editor._find_match_near_cursor() == backward
+
+    def test_sparse_literal_search_positions(self):
+        lines = ['"k": 0'] * 20
+        lines[3] = '"key": "key"'
+        lines[17] = '  "key": 1'
+        editor = JsonEditor("\n".join(lines))
+        editor._search_buffer = "key"
+        editor._execute_search()
+        assert editor._search_matches == [(3, 1, 4), (3, 8, 11), (17, 3, 6)]
+
+    def test_repeated_search_reuses_matches(self):
+        editor = JsonEditor('"foo": 1\n"foo": 2')
+        editor._search_buffer = "foo"
+        editor._execute_search()
+        matches = editor._search_matches
+        editor._execute_search()
+        assert editor._search_matches is matches
+
+        # 편집 후에는 다시 스캔
+        editor._mutate(1, 2, ['"bar": 2'])
+        editor._execute_search()
+        assert editor._search_matches == [(0, 1, 4)]
+
     def test_search_with_equals_filter(self):
         editor = JsonEditor('{"users": [{"name": "John"}, {"name": "Jane"}]}')
         editor._search_buffer = '$.users[*].name="John"'
@@ -587,6 +1169,16 @@ class TestHistory:
 
         assert editor._command_history == ["w", "fmt"]
 
+    def test_add_to_search_history_bounded(self):
+        editor = JsonEditor()
+        for i in range(editor._search_history_max + 5):
+            editor._add_to_search_history(f"p{i}")
+        editor._add_to_search_history("p10")
+        history = editor._search_history
+        assert len(history) == editor._search_history_max
+        assert history[:2] == ["p10", f"p{editor._search_history_max + 4}"]
+        assert history.count("p10") == 1
+
     def test_command_history_navigation(self):
         editor = JsonEditor()
         editor._command_history = ["c", "b", "a"]
@@ -983,6 +1575,14 @@ class TestStringCollapse:
         editor = JsonEditor(self.SAMPLE)
         assert editor._find_long_string_at(0) is None
 
+    def test_find_long_string_at_escaped_quotes(self):
+        """이스케이프된 따옴표는 문자열 끝으로 보지 않음."""
+        value = 'a\\"b' * 30
+        editor = JsonEditor(f'{{"k": "{value}"}}')
+        qs, qe, slen = editor._find_long_string_at(0)
+        assert (qs, slen) == (6, len(value))
+        assert editor.lines[0][qe:] == "}"
+
     def test_toggle_collapse(self):
         """za: 긴 string 토글."""
         editor = JsonEditor(self.SAMPLE)
@@ -1393,6 +1993,30 @@ class TestVisualMode:
         assert len(editor.lines) == 2
         assert editor.lines[1] == '    "new": true'
 
+    def test_linewise_change_undo_restores_lines(self):
+        editor = self._make_editor("a\n    b\nc\nd")
+        editor._visual_mode = "V"
+        editor._visual_anchor_row = 1
+        editor.cursor_row = 2
+        editor._handle_normal(self._key("c"))
+        assert editor.lines == ["a", "    ", "d"]
+        assert (editor.cursor_row, editor.cursor_col) == (1, 4)
+        assert editor.undo_stack[-1][:3] == (1, 1, ["    b", "c"])
+        editor._undo()
+        assert editor.lines == ["a", "    b", "c", "d"]
+
+    def test_multiline_paste_is_single_undo_range(self):
+        editor = self._make_editor("ab\ncd")
+        editor._yank_type = "char"
+        editor.yank_buffer = ["X\nY\nZ"]
+        editor.cursor_row = 0
+        editor.cursor_col = 0
+        editor._paste_after()
+        assert editor.lines == ["aX", "Y", "Zb", "cd"]
+        assert (editor.cursor_row, editor.cursor_col) == (2, 0)
+        editor._undo()
+        assert editor.lines == ["ab", "cd"]
+
     # -- read-only --
 
     def test_readonly_allows_yank(self):
@@ -1514,6 +2138,10 @@ class TestSubstitute:
         editor = JsonEditor(content)
         editor._exec_command("2,4s/old/new/g")
         assert editor.lines == ["old", "new", "new", "new", "old"]
+        start, tail, old_lines, _, _ = editor.undo_stack[-1]
+        assert (start, tail, old_lines) == (1, 1, ["old"] * 3)
+        editor._undo()
+        assert editor.lines == ["old"] * 5
 
     def test_ignore_case(self):
         """`:s/old/new/gi` — 대소문자 무시."""